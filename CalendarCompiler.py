@@ -6,24 +6,27 @@ Handles command-line arguments, settings, and orchestration of calendar output.
 """
 import json
 import argparse
+import logging
 import os
 import sys
 import platform
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from modules import svg_calendar
 from modules.helpers import (
     load_json,
     save_json,
-    merge_holiday_data,
+    merge_holiday_sources,
     load_settings,
     get_api_key,
     is_enabled,
+    index_holidays_by_month,
     export_holiday_validation_file
 )
 from modules import calendar_events
-from modules import api_connectors
-from modules import export_calander
-from modules.variable_events import build_variable_event_dataset
+# svg_calendar, export_calander and api_connectors are imported where used,
+# so runs that skip SVG generation, export or the Calendarific fetch don't pay for them
+from modules.variable_events import build_variable_event_datasets
 from modules.event_loader import (
     load_international_events,
     load_retro_events,
@@ -34,21 +37,33 @@ from modules.event_loader import (
 
 # One of my fave hacks for force lowercase on CLI Switches
 # But not always recommended
-class CaseInsensitiveArgumentParser(argparse.ArgumentParser):
-    """ArgumentParser that supports case-insensitive command-line flags."""
+def _lowercase_flags(argv):
+    """
+    Lower-case long option names in one upfront pass so CLI switches are case-insensitive.
+
+    Only the flag name is lowered; any attached value (--artwork=Some/Path) keeps its case.
 
-    def _parse_optional(self, arg_string):
-        if arg_string.startswith('--'):
-            # Try to match argument names in lower-case
-            arg_string = arg_string.lower()
-            # If you want, map specific aliases here...
-        return super()._parse_optional(arg_string)
+    Args:
+        argv (list): Raw command-line arguments (excluding the program name).
 
+    Returns:
+        list: Arguments with '--Flag' style names lower-cased.
+    """
+    lowered = []
+    for arg in argv:
+        if arg.startswith('--'):
+            flag, sep, value = arg.partition('=')
+            arg = flag.lower() + sep + value
+        lowered.append(arg)
+    return lowered
+
+@lru_cache(maxsize=1)
 def parse_cli_args():
     """
     Parse CLI for SVG Calendar Generator.
 
-    Only set a value if the user provides the flag.
+    Only set a value if the user provides the flag. Flags are case-insensitive.
+    Parsed once per run and memoised, so repeat callers share the same Namespace.
     """
     parser = argparse.ArgumentParser(description="SVG Calendar Generator")
 
@@ -105,14 +120,48 @@ def parse_cli_args():
     parser.add_argument('--compileonly', action='store_true',
                         help='Compile the Calendar without generating the SVG Files (Use existing/edited)')
 
-    return parser.parse_args()
-
+    # Only report warnings from the export steps
+    parser.add_argument('--quiet', action='store_true',
+                        help='Suppress export progress messages (warnings are still shown)')
+
+    return parser.parse_args(_lowercase_flags(sys.argv[1:]))
+
+
+# CLI flag -> (settings path, value to set). A value of None copies the
+# argument's own value (e.g. --year 2027); anything else is a fixed override.
+_CLI_SETTINGS_MAP = [
+    ("official",      ("include_days", "international", "official"), True),
+    ("semi_official", ("include_days", "international", "semi_official"), True),
+    ("fun",           ("include_days", "international", "fun"), True),
+    ("retro",         ("include_days", "retro"), True),
+    ("religious",     ("include_days", "religious"), True),
+    ("uk_holidays",   ("include_days", "uk_holidays"), True),
+    ("custom_events", ("include_days", "custom_events"), True),
+    ("country_list",  ("include_days", "country_list"), True),
+    ("year",          ("year",), None),
+    ("open",          ("OpenOnCompletion",), True),
+    ("exportpdf",     ("output", "export_pdf"), True),
+    ("exportpng",     ("output", "export_png"), True),
+    ("exportjpg",     ("output", "export_jpg"), True),
+    ("artwork",       ("art_files", "artwork_folder"), None),
+    ("exportto",      ("output", "pdf_dir"), None),
+    ("cleanup",       ("art_files", "cleanup"), True),
+    ("quiet",         ("quiet",), True),
+]
+
+def _set_nested(settings, path, value):
+    """Set settings[path[0]][path[1]]... = value, creating missing dicts on the way."""
+    node = settings
+    for key in path[:-1]:
+        node = node.setdefault(key, {})
+    node[path[-1]] = value
 
 def update_settings_with_cli(settings, args):
     """
     Update include_days flags in settings from CLI if present.
 
     Supports nested international options for official/semi_official/fun flags.
+    Simple overrides are driven by the _CLI_SETTINGS_MAP table.
 
     Args:
         settings (dict): Config dict with 'include_days'.
@@ -121,91 +170,86 @@ def update_settings_with_cli(settings, args):
     Returns:
         dict: Updated settings dict.
     """
-    # Ensure include_days exists
-    if "include_days" not in settings:
-        settings["include_days"] = {}
+    # Ensure include_days and its nested international section exist
+    include_days = settings.setdefault("include_days", {})
+    include_days.setdefault("international", {})
 
-    # Handle nested international flags
+    # --international switches on every international sub-category at once
     if getattr(args, "international", False):
-        settings["include_days"]["international"] = {
+        include_days["international"] = {
             "official": True,
             "semi_official": True,
             "fun": True
         }
-    else:
-        if "international" not in settings["include_days"]:
-            settings["include_days"]["international"] = {}
-
-        # Apply fine-grained overrides if set
-        for subkey in ["official", "semi_official", "fun"]:
-            if getattr(args, subkey, False):
-                settings["include_days"]["international"][subkey] = True
-
-    # Handle other flags
-    for key in ["retro", "religious", "uk_holidays", "custom_events", "country_list"]:
-        if getattr(args, key, False):
-            settings["include_days"][key] = True
-
-    # Year override
-    if getattr(args, "year", None):
-        settings["year"] = args.year
-
-    # Open on completion override
-    if getattr(args, "open", None):
-        settings["OpenOnCompletion"] = True
-
-    for export_flag, setting_key in [
-        ("exportpdf", "export_pdf"),
-        ("exportpng", "export_png"),
-        ("exportjpg", "export_jpg"),
-    ]:
-        if getattr(args, export_flag, False):
-            if "output" not in settings:
-                settings["output"] = {}
-            settings["output"][setting_key] = True
-
-    # Artwork folder override
-    if getattr(args, "artwork", None):
-        if "art_files" not in settings:
-            settings["art_files"] = {}
-        settings["art_files"]["artwork_folder"] = args.artwork
-
-    # Export folder override
-    if getattr(args, "exportto", None):
-        if "output" not in settings:
-            settings["output"] = {}
-        settings["output"]["pdf_dir"] = args.exportto
-
-    # Cleanup override
-    if getattr(args, "cleanup", None):
-        if "art_files" not in settings:
-            settings["art_files"] = {}
-        settings["art_files"]["cleanup"] = True
+
+    for arg_name, path, value in _CLI_SETTINGS_MAP:
+        arg_value = getattr(args, arg_name, None)
+        if arg_value:
+            _set_nested(settings, path, arg_value if value is None else value)
 
     return settings
 
 
-def generate_all_svgs(settings, holiday_data):
+def _render_month(task):
+    """
+    Render a single month's SVG calendar (worker for generate_all_svgs).
+
+    Kept at module level so it can be pickled for the process pool.
+
+    Args:
+        task (tuple): (year, month, svg_dir, holiday_data, settings)
+
+    Returns:
+        None
+    """
+    from modules import svg_calendar
+
+    year, month, svg_dir, holiday_data, settings = task
+    svg_calendar.generate_svg_calendar(year, month, output_dir=svg_dir, holidays=holiday_data,
+                                       settings=settings)
+
+
+def generate_all_svgs(settings, holiday_data, compile_fn=None):
     """
     Generate SVG calendar files for all twelve months using project settings.
 
-    This function iterates over all months in the configured calendar year,
-    generating an SVG calendar for each month using the specified output directory.
+    Each month is independent, so the twelve months are rendered in parallel
+    across a process pool, writing into the specified output directory.
     The output directory is determined from settings['output']['svg_dir'].
-    Holidays are passed to each month for annotation.
+    Holidays are split by month once and each month receives only its own slice.
 
     Args:
         settings (dict): Project settings, including 'output' with 'svg_dir'.
         holiday_data (dict): Holiday/event data to annotate in each month.
+        compile_fn (callable, optional): Called with a {month: Future} map as soon as
+            every month is queued, so compilation can pick up each month's SVG the
+            moment it is written instead of waiting for all twelve.
 
     Returns:
         None
     """
+    from modules import svg_calendar
+
     svg_dir = settings.get('output', {}).get('svg_dir', './calendars')
     year = int(settings['year'])
-    for month in range(1, 13):
-        print(f"Generating SVG for {year}-{month:02d} in {svg_dir}")
-        svg_calendar.generate_svg_calendar(year, month, output_dir=svg_dir, holidays=holiday_data)
+    os.makedirs(svg_dir, exist_ok=True)
+
+    # Each worker only needs (and is only sent) its own month's holidays
+    holidays_by_month = index_holidays_by_month(holiday_data)
+
+    with ProcessPoolExecutor(max_workers=min(12, os.cpu_count() or 1)) as executor:
+        svg_futures = {}
+        for month in range(1, 13):
+            print(f"Generating SVG for {year}-{month:02d} in {svg_dir}")
+            month_holidays = holidays_by_month.get(f"{year}-{month:02d}", {})
+            svg_futures[month] = executor.submit(_render_month, (year, month, svg_dir, month_holidays, settings))
+
+        if compile_fn:
+            compile_fn(svg_futures)
+
+        # Surface any rendering errors
+        for future in svg_futures.values():
+            future.result()
 
     legend_svg_path = os.path.join(settings['output']['svg_dir'], 'legend.svg')
 
@@ -219,8 +263,8 @@ def generate_all_svgs(settings, holiday_data):
         full_branding += " | " + branding_url
 
     svg_calendar.generate_legend_svg(
-        calendar_events.COUNTRY_COLOURS,
-        calendar_events.EVENT_TYPES,
+        calendar_events.COUNTRY_COLOURS_ITEMS,
+        calendar_events.EVENT_TYPES_ITEMS,
         legend_svg_path,
         num_cols=5,
         branding_text=full_branding
@@ -245,13 +289,12 @@ def load_event_data_from_options(settings, year):
     Returns:
         dict: Combined holiday data dictionary with merged events.
     """
-    holiday_data = {}
-
     #if is_enabled(settings, "uk_holidays"):
         # Load Country Holiday List (using existing calendar_events code)
-    raw = calendar_events.get_combined_holidays(settings)
-    merge_holiday_data(raw, load_uk_events(year))
-    holiday_data = raw
+    holiday_data = calendar_events.get_combined_holidays(settings)
+
+    # Collect every enabled source first, then merge them all in one pass
+    sources = [load_uk_events(year)]
 
     # Load Religious holidays (Calendarific API)
     if is_enabled(settings, "religious"):
@@ -260,38 +303,51 @@ def load_event_data_from_options(settings, year):
             all_faiths = load_json(cache_path)
             print(f"Loaded multi-faith holidays from cache: {cache_path}")
         except (FileNotFoundError, json.JSONDecodeError):
+            from modules import api_connectors
+
             print("Fetching fresh multi-faith holiday data from Calendarific...")
             api_key = get_api_key(settings, "API_KEY", "./.env")
-            raw_data = api_connectors.fetch_calendarific_json(api_key, year)
-            all_faiths = api_connectors.extract_multi_faith_holidays(raw_data)
-            save_json(all_faiths, cache_path)
-            print(f"Saved fresh multi-faith data to cache: {cache_path}")
-        merge_holiday_data(holiday_data, all_faiths)
+            holidays = api_connectors.iter_calendarific_holidays(api_key, year)
+            all_faiths = api_connectors.extract_multi_faith_holidays(holidays)
+            # An empty result is not cached, so the next run fetches again
+            if all_faiths:
+                save_json(all_faiths, cache_path)
+                print(f"Saved fresh multi-faith data to cache: {cache_path}")
+            else:
+                print("No multi-faith holidays returned; nothing cached")
+        sources.append(all_faiths)
 
     # Load User Custom Events as defined in the file
     if is_enabled(settings, "custom_events"):
-        merge_holiday_data(holiday_data, load_custom_events(year))
+        sources.append(load_custom_events(year))
 
     # Load File-Based Event Sources
     if is_enabled(settings, "retro"):
-        merge_holiday_data(holiday_data, load_retro_events(year))
+        sources.append(load_retro_events(year))
 
     if is_enabled(settings, "international"):
         intl_cfg = settings.get("include_days", {}).get("international", {})
-        merge_holiday_data(holiday_data, load_international_events(year, intl_cfg))
+        sources.append(load_international_events(year, intl_cfg))
 
-    # Load rule engine for local country (always)
+    # Load rule engine for local country (always), plus each additional
+    # country when country_list is enabled, computed together in one batch
     local_country = settings.get("local_country", "GB")
-    merge_holiday_data(holiday_data, build_variable_event_dataset(year, local_country))
-
-    # If country_list is enabled — also run for each additional country
+    country_codes = [local_country]
     if settings.get("include_days", {}).get("country_list", False):
         for code in settings.get("include_country_list", {}).get("countries", []):
             # Skip if we're already handled local_country above
             if code != local_country:
-                merge_holiday_data(holiday_data, build_variable_event_dataset(year, code))
-                merge_holiday_data(holiday_data, load_cultural_events(year))
+                country_codes.append(code)
+
+    local_events, *country_events = build_variable_event_datasets(year, country_codes)
+    sources.append(local_events)
+    sources.extend(country_events)
+
+    # Cultural events cover every country in one file, so merge them once
+    if country_events:
+        sources.append(load_cultural_events(year))
 
+    merge_holiday_sources(holiday_data, sources)
 
     holiday_data = calendar_events.canonicalise_holiday_data(holiday_data)
 
@@ -304,19 +360,30 @@ def load_event_data_from_options(settings, year):
     
     return holiday_data
 
-def compile_calendar(settings):
-    """Compile the Calendar based on user options."""
+def compile_calendar(settings, svg_futures=None):
+    """
+    Compile the Calendar based on user options.
+
+    Args:
+        settings (dict): Project settings.
+        svg_futures (dict, optional): {month: Future} for SVGs still being generated;
+            each export waits on a month's future just before it needs that SVG.
+    """
     # Handle export formats based on config
     output_settings = settings.get("output", {})
+    if not any(output_settings.get(key, False) for key in ("export_pdf", "export_png", "export_jpg")):
+        return
+
+    from modules import export_calander
 
     if output_settings.get("export_pdf", False):
-        export_calander.export_calendar_pdf(settings)
+        export_calander.export_calendar_pdf(settings, svg_futures)
 
     if output_settings.get("export_png", False):
-        export_calander.export_calendar_pngs(settings)
+        export_calander.export_calendar_pngs(settings, svg_futures)
 
     if output_settings.get("export_jpg", False):
-        export_calander.export_calendar_jpgs(settings)
+        export_calander.export_calendar_jpgs(settings, svg_futures)
 
 def clear_screen():
     """Clear the terminal screen in a cross-platform safe way."""
@@ -407,6 +474,16 @@ def main():
     settings = update_settings_with_cli(settings, args)
     year = settings.get("year", datetime.now().year)
 
+    # Export progress goes through logging; plain messages on stdout, like print().
+    # Only this project's loggers are configured, leaving the root logger (and
+    # third-party libraries' output) alone
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    project_log = logging.getLogger("modules")
+    project_log.addHandler(handler)
+    project_log.setLevel(logging.WARNING if settings.get("quiet", False) else logging.INFO)
+    project_log.propagate = False
+
     display_banner(settings)
 
 
@@ -417,17 +494,18 @@ def main():
     # Load all holiday event data based on user config
     holiday_data = load_event_data_from_options(settings, year)
 
-    # Generate SVG Calendar
-    if not args.compileonly:
-        generate_all_svgs(settings, holiday_data)
-    else:
+    if args.compileonly:
+        # Compile from existing (possibly hand-edited) SVG files
         print("Not generating the Calendar SVG Files at user request")
-
-    # If generating SVGs only (for user review/manual editing) don't compile the calendar
-    if not args.svgonly:
         compile_calendar(settings)
-    else:
+    elif args.svgonly:
+        # If generating SVGs only (for user review/manual editing) don't compile the calendar
+        generate_all_svgs(settings, holiday_data)
         print("Calendar NOT Compiled as user requested SVG Generation ONLY")
+    else:
+        # Generate SVG Calendar, compiling each month as soon as its SVG is written
+        generate_all_svgs(settings, holiday_data,
+                          compile_fn=lambda svg_futures: compile_calendar(settings, svg_futures))
 
     # Debug for the time being
     export_holiday_validation_file(settings, holiday_data)
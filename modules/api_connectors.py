@@ -3,12 +3,102 @@ API connector utilities for retrieving holiday and calendar event data.
 
 Handles requests to external holiday APIs and formats results for calendar integration.
 """
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import ahocorasick  # Optional: pyahocorasick multi-pattern matcher
+except ImportError:
+    ahocorasick = None
+
+try:
+    import ijson  # Optional: incremental JSON parser for streamed responses
+except ImportError:
+    ijson = None
+
+CALENDARIFIC_URL = "https://calendarific.com/api/v2/holidays"
+
+# (connect, read) timeouts in seconds for API calls
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Shared session: keeps connections alive between calls and retries transient failures
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(max_retries=Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504]
+)))
+
+# Religion keyword -> display colour. Order matters: the first keyword
+# (in this order) found in any field wins.
+RELIGION_COLOURS = {
+    "jewish": "#D28800",
+    "hebrew": "#D28800",
+    "muslim": "green",
+    "islamic": "green",
+    "christian": "purple",
+    "orthodox": "purple",
+    "hindu": "#AD9200",
+    "buddh": "saddlebrown",
+}
+
+# Single compiled pattern covering every keyword
+_RELIGION_RE = re.compile("|".join(RELIGION_COLOURS))
+_TOP_RELIGION = next(iter(RELIGION_COLOURS))
+
+# Aho-Corasick automaton over the same keywords, used when pyahocorasick is installed
+if ahocorasick is not None:
+    _RELIGION_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in RELIGION_COLOURS:
+        _RELIGION_AUTOMATON.add_word(_keyword, _keyword)
+    _RELIGION_AUTOMATON.make_automaton()
+else:
+    _RELIGION_AUTOMATON = None
+
+
+def _religion_keywords_in(blob: str) -> set:
+    """
+    Return the set of religion keywords found anywhere in a lowercased text blob.
+
+    Uses a single Aho-Corasick pass when pyahocorasick is available,
+    otherwise falls back to the precompiled regex.
+    """
+    if _RELIGION_AUTOMATON is not None:
+        return {keyword for _, keyword in _RELIGION_AUTOMATON.iter(blob)}
+    return set(_RELIGION_RE.findall(blob))
+
+def _calendarific_params(api_key, year, country):
+    """Build the query parameters for a Calendarific religious holiday request."""
+    return {
+        "api_key": api_key,
+        "country": country,
+        "year": year,
+        "type": "religious"
+    }
+
+def _iter_holidays(raw_json):
+    """
+    Iterate holiday records from either a parsed Calendarific response or a holiday stream.
+
+    Args:
+        raw_json (dict or iterable): Full response dict, or an iterable of holiday dicts
+            such as the one returned by iter_calendarific_holidays().
+
+    Returns:
+        iterable: Holiday dictionaries.
+    """
+    if isinstance(raw_json, dict):
+        return raw_json.get("response", {}).get("holidays", [])
+    return raw_json
 
 def fetch_calendarific_json(api_key, year=2026, country="GB"):
     """
     Fetch religious holiday data from the Calendarific API for a given year and country.
 
+    Uses a shared keep-alive session with automatic retries on transient errors.
+
     Args:
         api_key (str): Your Calendarific API key.
         year (int, optional): The target year for which holidays should be retrieved. Defaults to 2026.
@@ -18,18 +108,71 @@ def fetch_calendarific_json(api_key, year=2026, country="GB"):
         dict: Parsed JSON response from the Calendarific API containing holiday data.
 
     Raises:
-        requests.RequestException: If the HTTP request fails or times out.
+        requests.RequestException: If the HTTP request fails, times out, or returns an error status.
     """
-    url = "https://calendarific.com/api/v2/holidays"
-    params = {
-        "api_key": api_key,
-        "country": country,
-        "year": year,
-        "type": "religious"
-    }
-    response = requests.get(url, params=params)
+    params = _calendarific_params(api_key, year, country)
+    response = _SESSION.get(CALENDARIFIC_URL, params=params, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
     return response.json()
 
+def _no_holidays_error(meta_code):
+    """Build the error raised when a Calendarific response has no holiday list."""
+    return ValueError(f"Calendarific response has no holiday list (meta.code: {meta_code})")
+
+def iter_calendarific_holidays(api_key, year=2026, country="GB"):
+    """
+    Stream religious holiday records from the Calendarific API one at a time.
+
+    When ijson is installed the response body is parsed incrementally, so the
+    full JSON tree is never held in memory. Otherwise falls back to a normal
+    fetch and yields from the parsed response.
+
+    Args:
+        api_key (str): Your Calendarific API key.
+        year (int, optional): The target year. Defaults to 2026.
+        country (str, optional): The 2-letter ISO country code. Defaults to 'GB'.
+
+    Yields:
+        dict: Individual holiday records from response.holidays.
+
+    Raises:
+        requests.RequestException: If the HTTP request fails, times out, or returns an error status.
+        ValueError: If the response carries no response.holidays list, e.g. an
+            API error body such as an invalid key or exceeded quota.
+    """
+    if ijson is None:
+        raw_json = fetch_calendarific_json(api_key, year, country)
+        body = raw_json.get("response")
+        if not isinstance(body, dict) or not isinstance(body.get("holidays"), list):
+            raise _no_holidays_error(raw_json.get("meta", {}).get("code"))
+        yield from body["holidays"]
+        return
+
+    params = _calendarific_params(api_key, year, country)
+    with _SESSION.get(CALENDARIFIC_URL, params=params,
+                      timeout=REQUEST_TIMEOUT, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True  # Transparently handle gzip encoding
+        seen = {}
+        events = _watch_response_events(ijson.parse(response.raw), seen)
+        yield from ijson.items(events, "response.holidays.item")
+        if "holidays" not in seen:
+            raise _no_holidays_error(seen.get("meta.code"))
+
+def _watch_response_events(events, seen):
+    """
+    Pass ijson parse events through, noting the parts of the response envelope seen.
+
+    Records whether the response.holidays array started, and the meta.code value,
+    so an error body can be told apart from a year with no holidays.
+    """
+    for prefix, event, value in events:
+        if prefix == "response.holidays" and event == "start_array":
+            seen["holidays"] = True
+        elif prefix == "meta.code":
+            seen["meta.code"] = value
+        yield prefix, event, value
+
 def extract_multi_faith_holidays(raw_json) -> dict:
     """
     Extract and categorise religious holidays from Calendarific's JSON response by faith group.
@@ -45,52 +188,47 @@ def extract_multi_faith_holidays(raw_json) -> dict:
         - Buddhist
 
     Args:
-        raw_json (dict): The raw JSON dictionary returned by the Calendarific API.
+        raw_json (dict or iterable): The raw JSON dictionary returned by the Calendarific API,
+            or a stream of holiday records from iter_calendarific_holidays().
 
     Returns:
         dict: A dictionary where keys are ISO-formatted date strings (YYYY-MM-DD),
               and values are dictionaries with "label" (event name) and "colour" (string colour code).
     """
-    colour_map = {
-        "jewish": "#D28800",
-        "hebrew": "#D28800",
-        "muslim": "green",
-        "islamic": "green",
-        "christian": "purple",
-        "orthodox": "purple",
-        "hindu": "#AD9200",
-        "buddh": "saddlebrown",  
-    }
+    # Per date: ordered set of labels (dict keys) and the first matched colour
+    date_labels = {}
+    date_colours = {}
 
-    multi_holidays = {}
-
-    for holiday in raw_json.get("response", {}).get("holidays", []):
-        types = [t.lower() for t in holiday.get("type", [])]
-        primary = holiday.get("primary_type", "").lower()
-        name = holiday.get("name", "").lower()
-        desc = holiday.get("description", "").lower()
+    for holiday in _iter_holidays(raw_json):
+        # Cheap type fields first. The longer name/description text is only lowered
+        # and scanned when the top-priority keyword has not already been found.
+        found = _religion_keywords_in(
+            "\x00".join((holiday.get("primary_type", ""), *holiday.get("type", []))).lower()
+        )
+        if _TOP_RELIGION not in found:
+            found |= _religion_keywords_in(
+                "\x00".join((holiday.get("name", ""), holiday.get("description", ""))).lower()
+            )
 
-        # Match based on any keyword
-        matched_religion = next((
-            religion for religion in colour_map
-            if religion in primary or
-               any(religion in t for t in types) or
-               religion in name or
-               religion in desc
-        ), None)
+        # Match based on any keyword, honouring RELIGION_COLOURS priority order
+        matched_religion = next((r for r in RELIGION_COLOURS if r in found), None)
 
         if matched_religion:
             date_key = holiday["date"]["iso"]
             label = holiday["name"]
-            colour = colour_map[matched_religion]
+            colour = RELIGION_COLOURS[matched_religion]
 
-            if date_key in multi_holidays:
-                if label not in multi_holidays[date_key]["label"]:
-                    multi_holidays[date_key]["label"] += f"\n{label}"
+            if date_key in date_labels:
+                date_labels[date_key][label] = None
             else:
-                multi_holidays[date_key] = {"label": label, "colour": colour}
+                date_labels[date_key] = {label: None}
+                date_colours[date_key] = colour
 
-    return multi_holidays
+    # Join each date's distinct labels once, in first-seen order
+    return {
+        date_key: {"label": "\n".join(labels), "colour": date_colours[date_key]}
+        for date_key, labels in date_labels.items()
+    }
 
 def extract_jewish_holidays_from_calendarific(raw_json) -> dict:
     """
@@ -104,7 +242,8 @@ def extract_jewish_holidays_from_calendarific(raw_json) -> dict:
     each containing a label and a fixed colour ("#D28800") for Jewish events.
 
     Args:
-        raw_json (dict): The raw JSON object returned from Calendarific API.
+        raw_json (dict or iterable): The raw JSON object returned from Calendarific API,
+            or a stream of holiday records from iter_calendarific_holidays().
 
     Returns:
         dict: A dictionary mapping date strings to holiday metadata.
@@ -116,19 +255,14 @@ def extract_jewish_holidays_from_calendarific(raw_json) -> dict:
     """
     jewish_holidays = {}
 
-    for holiday in raw_json.get("response", {}).get("holidays", []):
-        # Check primary type or type list or name for indicators
-        primary = holiday.get("primary_type", "").lower()
-        types = [t.lower() for t in holiday.get("type", [])]
-        name = holiday.get("name", "").lower()
-        desc = holiday.get("description", "").lower()
+    for holiday in _iter_holidays(raw_json):
+        # Check primary type or type list for jewish/hebrew, name or description for jewish
+        type_blob = "\x00".join((holiday.get("primary_type", ""), *holiday.get("type", []))).lower()
 
+        # Only lower the name/description text if the type fields did not match
         is_jewish = (
-            "jewish" in primary or
-            "hebrew" in primary or
-            any("jewish" in t or "hebrew" in t for t in types) or
-            "jewish" in desc or
-            "jewish" in name
+            not {"jewish", "hebrew"}.isdisjoint(_religion_keywords_in(type_blob)) or
+            "jewish" in "\x00".join((holiday.get("name", ""), holiday.get("description", ""))).lower()
         )
 
         if is_jewish:
@@ -6,9 +6,12 @@ and assigning different colours for each region.
 """
 import os
 import re
+import sys
 import calendar
 import datetime
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import holidays as myholidays
 from modules.helpers import (
     remap_null_keys,
@@ -21,27 +24,46 @@ from .holiday_types import MultiColourHolidayDict, HolidayLine
 CONFIG_DIR = os.path.join(os.path.dirname(__file__), '..', 'config')
 
 EVENT_TYPES = load_json_cached(os.path.join(CONFIG_DIR, 'event_types.json'))
-COUNTRY_COLOURS = load_json_cached(os.path.join(CONFIG_DIR, 'iso_country_colours.json'))
+# Colour values are interned so every entry built from them shares one string object
+COUNTRY_COLOURS = {
+    cc: sys.intern(colour)
+    for cc, colour in load_json_cached(os.path.join(CONFIG_DIR, 'iso_country_colours.json')).items()
+}
 ISO_COUNTRY_NAMES = load_json_cached(os.path.join(CONFIG_DIR, 'iso_country_names.json'))
 
+# Flat (key, colour) tuples for sequential consumers such as the legend renderer
+COUNTRY_COLOURS_ITEMS = tuple(sorted(COUNTRY_COLOURS.items()))
+EVENT_TYPES_ITEMS = tuple(EVENT_TYPES.items())
+
 # Special case, can't have key of None in JSON, so work around...
 aus_region_colours_raw = load_json_cached(os.path.join(CONFIG_DIR, 'australian_region_colours.json'))
 
 # Convert NATIONAL key to None
-AUS_REGION_COLOURS = remap_null_keys(aus_region_colours_raw, null_key='NATIONAL')
+AUS_REGION_COLOURS = {
+    region: sys.intern(colour)
+    for region, colour in remap_null_keys(aus_region_colours_raw, null_key='NATIONAL').items()
+}
+
+# Precompiled label patterns
+_OBSERVED_STACK_RE = re.compile(r"(observed(?:,\s*observed)+)")
+_OBSERVED_EMPTY_RE = re.compile(r"\(observed(?:,\s*)*\)")
+_AU_LABEL_RE = re.compile(r"^(.*) \(([^)]+)\)$")
 
 def normalise_label(label: str) -> str:
     """Clean redundant suffixes in label strings for stable deduplication."""
+    # Every cleanup below needs an "observed," run; most labels have none
+    if "observed," not in label:
+        return label
+
     # Simplify redundant 'observed' stacking
-    pattern = re.compile(r"(observed(?:,\s*observed)+)")
-    label = pattern.sub("observed", label)
+    label = _OBSERVED_STACK_RE.sub("observed", label)
 
     # If somehow multiple parentheses appear, strip down
     while "(observed, observed" in label:
         label = label.replace("(observed, observed", "(observed")
 
     # Remove trailing junk commas
-    label = re.sub(r"\(observed(?:,\s*)*\)", "(observed)", label)
+    label = _OBSERVED_EMPTY_RE.sub("(observed)", label)
 
     return label
 
@@ -58,17 +80,13 @@ def canonicalise_holiday_data(holiday_data: dict) -> dict:
     cleaned_data = {}
 
     for date_key, data in holiday_data.items():
-        seen = set()
-        deduped_entries = []
+        # Keyed by (label, colour); dicts keep insertion order, so the first entry wins
+        deduped = {}
 
         for entry in data.get("entries", []):
-            # Build tuple key (label, colour)
-            entry_key = (normalise_label(entry["label"]), entry["colour"])
-            if entry_key not in seen:
-                seen.add(entry_key)
-                deduped_entries.append(entry)
+            deduped.setdefault((normalise_label(entry["label"]), entry["colour"]), entry)
 
-        cleaned_data[date_key] = {"entries": deduped_entries}
+        cleaned_data[date_key] = {"entries": list(deduped.values())}
 
     return cleaned_data
 
@@ -83,16 +101,21 @@ def smart_merge_au_holidays(holiday_data):
     Returns:
         MultiColourHolidayDict: With merged entries.
     """
-    import re
     merged = {}
 
     for date, data in holiday_data.items():
+        entries = data["entries"]
+        # A lone entry already reads "Name (REGION)", so there is nothing to merge
+        if len(entries) <= 1:
+            merged[date] = data
+            continue
+
         name_to_regions = {}
         name_to_colour = {}
 
-        for entry in data["entries"]:
+        for entry in entries:
             # Parse out name and region from label, e.g. "Christmas Day (NSW)"
-            m = re.match(r"^(.*) \(([^)]+)\)$", entry["label"])
+            m = _AU_LABEL_RE.match(entry["label"])
             if m:
                 name, region = m.group(1).strip(), m.group(2).strip()
             else:
@@ -112,8 +135,6 @@ def smart_merge_au_holidays(holiday_data):
 
     return merged
 
-from collections import defaultdict
-
 def merge_identical_holidays(holiday_data, merge_enabled=True, default_colour="black"):
     """
     Merge holiday entries for each date when multiple countries share an identical holiday name.
@@ -136,9 +157,8 @@ def merge_identical_holidays(holiday_data, merge_enabled=True, default_colour="b
     merged_data = {}
 
     for date, data in holiday_data.items():
-        name_to_countries = defaultdict(list)
-        name_to_colours = defaultdict(list)
-        canonical_to_display = {}
+        # canonical name -> (display name, countries, colours), in first-seen order
+        groups = {}
 
         for entry in data.get("entries", []):
             label = entry["label"]
@@ -148,8 +168,8 @@ def merge_identical_holidays(holiday_data, merge_enabled=True, default_colour="b
             cc = None
 
             # Extract (CC) suffix if present
-            if '(' in label and label.endswith(')'):
-                name_part, cc_part = label.rsplit('(', 1)
+            if label.endswith(')') and '(' in label:
+                name_part, _, cc_part = label.rpartition('(')
                 name = name_part.strip()
                 cc = cc_part[:-1].strip()
 
@@ -158,43 +178,28 @@ def merge_identical_holidays(holiday_data, merge_enabled=True, default_colour="b
                     cc = None
                     name = f"{name} (observed)"
 
-            # Build canonical key for internal merge
-            display_name = name  # preserve original name for output
-            canonical_name = canonicalise_label(display_name)
-
-            name_to_countries[canonical_name].append(cc)
-            name_to_colours[canonical_name].append(entry.get("colour", default_colour))
-
-            if canonical_name not in canonical_to_display:
-                canonical_to_display[canonical_name] = display_name
+            # Build canonical key for internal merge; the first display name is kept for output
+            canonical_name = canonicalise_label(name)
+            group = groups.get(canonical_name)
+            if group is None:
+                group = groups[canonical_name] = (name, [], [])
+            group[1].append(cc)
+            group[2].append(entry.get("colour", default_colour))
 
         merged_entries = []
 
-        for canonical_name, countries in name_to_countries.items():
-            display_name = canonical_to_display[canonical_name]
+        for display_name, countries, colours in groups.values():
             unique_countries = [c for c in countries if c]
 
-            # Colour selection logic (stable, deterministic)
-            colour_counts = defaultdict(int)
-            for colour in name_to_colours[canonical_name]:
-                colour_counts[colour] += 1
-
-            max_count = max(colour_counts.values())
-            most_common = [colour for colour, count in colour_counts.items() if count == max_count]
+            # Colour selection logic (stable, deterministic): Counter keeps first-seen
+            # order, so most_common(1) picks the earliest of any tied colours
+            colour_counts = Counter(colours)
 
             # Handle fully identical no-country situations
-            if all(cc is None for cc in name_to_countries[canonical_name]):
-                if len(set(name_to_colours[canonical_name])) > 1:
-                    entry_colour = "black"
-                else:
-                    entry_colour = name_to_colours[canonical_name][0]
+            if len(colour_counts) > 1 and all(cc is None for cc in countries):
+                entry_colour = "black"
             else:
-                for colour in name_to_colours[canonical_name]:
-                    if colour in most_common:
-                        entry_colour = colour
-                        break
-                else:
-                    entry_colour = default_colour
+                entry_colour = colour_counts.most_common(1)[0][0]
 
             # Build final merged label using display name
             if len(unique_countries) > 1:
@@ -211,31 +216,97 @@ def merge_identical_holidays(holiday_data, merge_enabled=True, default_colour="b
     return merged_data
 
 
-def get_multi_country_holidays(settings) -> MultiColourHolidayDict:
+@lru_cache(maxsize=None)
+def _country_holidays(country_code, subdiv, year):
+    """
+    Return the `holidays` dataset for a country/subdivision/year, memoised.
+
+    The returned object is shared between callers and must only be read.
+
+    Args:
+        country_code (str): ISO country code, e.g. 'GB' or 'AU'.
+        subdiv (str or None): Subdivision code/name, or None for national holidays.
+        year (int): Year to generate holidays for.
+
+    Returns:
+        holidays.HolidayBase: Mapping of date -> holiday name.
+    """
+    if subdiv:
+        return myholidays.country_holidays(country_code, years=year, subdiv=subdiv)
+    return myholidays.country_holidays(country_code, years=year)
+
+def _prefetch_country_holidays(requests):
+    """
+    Warm the _country_holidays cache for several datasets concurrently.
+
+    Small batches are left to be built on demand, where a pool would cost more
+    than it saves. Callers still read the datasets back in their own order, so
+    merge order is unchanged.
+
+    Args:
+        requests (list): (country_code, subdiv, year) tuples.
+    """
+    if len(requests) <= 3:
+        return
+    with ThreadPoolExecutor(max_workers=min(8, len(requests))) as pool:
+        for args in requests:
+            pool.submit(_country_holidays, *args)
+
+@lru_cache(maxsize=None)
+def _holiday_entry(label, colour) -> HolidayLine:
+    """
+    Return the shared entry dict for a label/colour pair.
+
+    Recurring holidays (across regions, years and rebuilds) reuse one dict rather
+    than allocating a new one each time, so entries must only be read.
+    """
+    return {"label": label, "colour": colour}
+
+def _add_unique_entry(holiday_data, seen_by_date, date_key, entry):
+    """
+    Append an entry to a date unless the same label and colour are already there.
+
+    seen_by_date tracks (label, colour) pairs per date, so the duplicate check is
+    a set lookup rather than a scan of the date's entry list.
+
+    Args:
+        holiday_data (MultiColourHolidayDict): Dataset being built (in-place modified).
+        seen_by_date (dict): {date_key: set of (label, colour)} kept in step with holiday_data.
+        date_key (str): ISO date string.
+        entry (HolidayLine): Entry to add.
+    """
+    key = (entry["label"], entry["colour"])
+    seen = seen_by_date.get(date_key)
+    if seen is None:
+        seen_by_date[date_key] = {key}
+        holiday_data[date_key] = {"entries": [entry]}
+    elif key not in seen:
+        seen.add(key)
+        holiday_data[date_key]["entries"].append(entry)
+
+def get_multi_country_holidays(countries, year: int) -> MultiColourHolidayDict:
     """
     Retrieve and combine holidays for multiple countries in a multi-entry format.
 
     Args:
-        settings (dict): Settings with 'holidays'/'countries' and 'year'.
+        countries (list): ISO country codes to include.
+        year (int): The year to generate holidays for.
 
     Returns:
         MultiColourHolidayDict: {ISO date: {"entries": [ {"label", "colour"}, ... ]}}
     """
-    countries = settings.get('include_country_list', {}).get('countries', [])
-    year = int(settings['year'])
     holiday_data: MultiColourHolidayDict = {}
+    seen_by_date = {}
+
+    _prefetch_country_holidays([(cc, None, year) for cc in countries])
 
     for cc in countries:
         colour = COUNTRY_COLOURS.get(cc, 'grey')
-        hdays = myholidays.country_holidays(cc, years=year)
+        hdays = _country_holidays(cc, None, year)
         for date, name in hdays.items():
-            date_key = date.strftime("%Y-%m-%d") if hasattr(date, "strftime") else str(date)
-            entry = {"label": f"{name} ({cc})", "colour": colour}
-            if date_key in holiday_data:
-                if entry not in holiday_data[date_key]["entries"]:
-                    holiday_data[date_key]["entries"].append(entry)
-            else:
-                holiday_data[date_key] = {"entries": [entry]}
+            date_key = date.isoformat() if hasattr(date, "isoformat") else str(date)
+            entry = _holiday_entry(f"{name} ({cc})", colour)
+            _add_unique_entry(holiday_data, seen_by_date, date_key, entry)
 
     return holiday_data
 
@@ -253,54 +324,44 @@ def get_combined_holidays(settings) -> MultiColourHolidayDict:
         MultiColourHolidayDict: Holidays ready for calendar rendering.
     """
     all_holidays = {}
+    seen_by_date = {}
 
     # Add UK holidays if enabled
     if settings.get('include_days', {}).get('uk_holidays', False):
         uk_holidays = get_uk_combined_holidays(int(settings['year']))
-        all_holidays.update(uk_holidays)
+        # Copy each date's entry list: later merges append to all_holidays in place,
+        # and the UK result is cached
+        for date, data in uk_holidays.items():
+            all_holidays[date] = {"entries": list(data["entries"])}
+            seen_by_date[date] = {(e["label"], e["colour"]) for e in data["entries"]}
 
     # Only process Country List if Country List Flag is Set.
     if settings.get("include_days", {}).get("country_list", False):
         # Parse countries list robustly
         icl = settings.get('include_country_list', {})
         if isinstance(icl, dict):
-            country_list = icl.get('countries', []).copy()
-        else:
-            country_list = list(icl)  # fallback if flat list
+            icl = icl.get('countries', [])  # otherwise fall back to a flat list
+        # Australia is handled separately below by its dedicated AU function
+        country_list = [cc for cc in icl if cc != "AU"]
 
-        # Special-case: Australia (call dedicated AU function and remove from country list)
-        if "AU" in country_list:
+        if len(country_list) != len(icl):
             au_holidays = get_au_combined_holidays(int(settings['year']))
             au_holidays = smart_merge_au_holidays(au_holidays)
             for date, data in au_holidays.items():
-                if date in all_holidays:
-                    for entry in data["entries"]:
-                        if entry not in all_holidays[date]["entries"]:
-                            all_holidays[date]["entries"].append(entry)
-                else:
-                    all_holidays[date] = data
-            country_list.remove("AU")
+                for entry in data["entries"]:
+                    _add_unique_entry(all_holidays, seen_by_date, date, entry)
 
         # Add other multi-country holidays if any left
         if country_list:
-            patched_settings = settings.copy()
-            # update the countries list in the correct structure
-            if isinstance(icl, dict):
-                patched_settings["include_country_list"]["countries"] = country_list
-            else:
-                patched_settings["include_country_list"] = country_list
-            mc_holidays = get_multi_country_holidays(patched_settings)
+            mc_holidays = get_multi_country_holidays(country_list, int(settings['year']))
             for date, data in mc_holidays.items():
-                if date in all_holidays:
-                    for entry in data["entries"]:
-                        if entry not in all_holidays[date]["entries"]:
-                            all_holidays[date]["entries"].append(entry)
-                else:
-                    all_holidays[date] = data
+                for entry in data["entries"]:
+                    _add_unique_entry(all_holidays, seen_by_date, date, entry)
 
     return all_holidays
 
 
+@lru_cache(maxsize=8)
 def get_au_combined_holidays(year: int) -> MultiColourHolidayDict:
     """
     Retrieve and combine Australian national and state/territory holidays for a given year.
@@ -325,39 +386,28 @@ def get_au_combined_holidays(year: int) -> MultiColourHolidayDict:
 
     Returns:
         MultiColourHolidayDict: A dictionary of ISO date strings to lists of holiday entries.
+            Cached per year, so callers must not modify it in place.
     """
-    # All state/territory codes (as used in `holidays`)
-    subdivisions = [None, "NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT"]
+    # All state/territory codes (as used in `holidays`); None is the national set
+    subdivisions = (None, "NSW", "VIC", "QLD", "SA", "WA", "TAS", "NT", "ACT")
 
     holiday_data: MultiColourHolidayDict = {}
+    seen_by_date = {}
 
-    def add_holiday(source, region_code):
-        """
-        Add holidays from a specific region/territory into the combined dictionary.
+    _prefetch_country_holidays([("AU", subdiv, year) for subdiv in subdivisions])
 
-        Args:
-            source (dict): Holidays dict from holidays.country_holidays().
-            region_code (str or None): Subdivision/state code.
-        """
-        colour = AUS_REGION_COLOURS.get(region_code, "grey")
-        for date, name in source.items():
-            date_key = date.strftime("%Y-%m-%d") if hasattr(date, "strftime") else str(date)
-            label = f"{name} ({region_code if region_code else 'National'})"
-            entry: HolidayLine = {"label": label, "colour": colour}
-            if date_key in holiday_data:
-                if entry not in holiday_data[date_key]["entries"]:
-                    holiday_data[date_key]["entries"].append(entry)
-            else:
-                holiday_data[date_key] = {"entries": [entry]}
-
-    # Loop through national (None) and all subdivisions
     for subdiv in subdivisions:
-        region_holidays = myholidays.country_holidays("AU", years=year, subdiv=subdiv) if subdiv else myholidays.country_holidays("AU", years=year)
-        add_holiday(region_holidays, subdiv)
+        colour = AUS_REGION_COLOURS.get(subdiv, "grey")
+        region_label = subdiv or "National"
+        for date, name in _country_holidays("AU", subdiv, year).items():
+            date_key = date.isoformat() if hasattr(date, "isoformat") else str(date)
+            entry = _holiday_entry(f"{name} ({region_label})", colour)
+            _add_unique_entry(holiday_data, seen_by_date, date_key, entry)
 
     return holiday_data
 
 
+@lru_cache(maxsize=8)
 def get_uk_combined_holidays(year: int) -> MultiColourHolidayDict:
     """
     Retrieve and combine UK national and regional holidays for a given year.
@@ -379,24 +429,25 @@ def get_uk_combined_holidays(year: int) -> MultiColourHolidayDict:
 
     Returns:
         MultiColourHolidayDict: A dictionary of ISO date strings to lists of holiday entries.
+            Cached per year, so callers must not modify it in place.
     """
     # Load region-specific holidays
-    uk = myholidays.UnitedKingdom(years=year)
-    scotland = myholidays.UnitedKingdom(years=year, subdiv="Scotland")
-    northern_ireland = myholidays.UnitedKingdom(years=year, subdiv="Northern Ireland")
-    wales = myholidays.UnitedKingdom(years=year, subdiv="Wales")
+    _prefetch_country_holidays(
+        [("GB", subdiv, year) for subdiv in (None, "Scotland", "Northern Ireland", "Wales")]
+    )
+    uk = _country_holidays("GB", None, year)
+    scotland = _country_holidays("GB", "Scotland", year)
+    northern_ireland = _country_holidays("GB", "Northern Ireland", year)
+    wales = _country_holidays("GB", "Wales", year)
 
     holiday_data: MultiColourHolidayDict = {}
+    seen_by_date = {}
 
     def add_holiday(source, colour: str):
         for date, name in source.items():
-            date_key = date.strftime("%Y-%m-%d")
-            entry: HolidayLine = {"label": name, "colour": colour}
-            if date_key in holiday_data:
-                if entry not in holiday_data[date_key]["entries"]:
-                    holiday_data[date_key]["entries"].append(entry)
-            else:
-                holiday_data[date_key] = {"entries": [entry]}
+            date_key = date.isoformat()
+            entry = _holiday_entry(name, colour)
+            _add_unique_entry(holiday_data, seen_by_date, date_key, entry)
 
     # Apply each region
     add_holiday(uk, "red")
@@ -413,26 +464,18 @@ def nth_weekday_of_month(year, month, weekday, n):
 
     E.g., second Sunday in May = nth_weekday_of_month(2026, 5, 6, 2)
     """
-    count = 0
-    for day in range(1, 32):
-        try:
-            dt = datetime.date(year, month, day)
-        except ValueError:
-            break
-        if dt.weekday() == weekday:
-            count += 1
-            if count == n:
-                return dt
-    return None
+    if n < 1:
+        return None
+    first = datetime.date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7 + 7 * (n - 1)
+    if offset >= calendar.monthrange(year, month)[1]:
+        return None
+    return first + datetime.timedelta(days=offset)
 
 def last_weekday_of_month(year, month, weekday):
     """Get the date of the last weekday (0=Monday) of a given month/year."""
-    last_day = calendar.monthrange(year, month)[1]
-    for day in range(last_day, 0, -1):
-        dt = datetime.date(year, month, day)
-        if dt.weekday() == weekday:
-            return dt
-    return None
+    last = datetime.date(year, month, calendar.monthrange(year, month)[1])
+    return last - datetime.timedelta(days=(last.weekday() - weekday) % 7)
 
 def add_variable_days(year, day_dict):
     """
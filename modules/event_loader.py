@@ -24,8 +24,13 @@ Functions:
     - load_uk_holidays(): Load UK public holidays.
     - load_custom_events(): Load user-defined custom events.
 
+Loaders are memoised per year (and options), so the returned dictionaries are
+shared and must be treated as read-only by callers.
+
 Author: Jason Brooks
 """
+from collections import defaultdict
+from functools import lru_cache
 from modules.helpers import (
     load_json, 
     update_year_key, 
@@ -44,17 +49,28 @@ def load_international_events(year :int, intl_settings: dict) -> dict:
     Returns:
         dict: Combined international holidays.
     """
+    return _load_international_events(
+        year,
+        bool(intl_settings.get("official", True)),
+        bool(intl_settings.get("semi_official", True)),
+        bool(intl_settings.get("fun", True))
+    )
+
+@lru_cache(maxsize=32)
+def _load_international_events(year: int, official: bool, semi_official: bool, fun: bool) -> dict:
+    """Cached worker for load_international_events, keyed on hashable options."""
     event_sources = []
 
-    if intl_settings.get("official", True):
+    if official:
         event_sources.append(load_json(resolve_config_path('official_days.json')))
-    if intl_settings.get("semi_official", True):
+    if semi_official:
         event_sources.append(load_json(resolve_config_path('semi_official_days.json')))
-    if intl_settings.get("fun", True):
+    if fun:
         event_sources.append(load_json(resolve_config_path('fun_days.json')))
 
     return update_year_key(year,merge_holiday_dicts(*event_sources))
 
+@lru_cache(maxsize=32)
 def load_religious_events(year: int) -> dict:
     """
     Load religious holidays from the religious_days.json configuration file.
@@ -66,6 +82,7 @@ def load_religious_events(year: int) -> dict:
     return update_year_key(year,load_json_cached(resolve_config_path('religious_days.json')))
 
 
+@lru_cache(maxsize=32)
 def load_retro_events(year: int) -> dict:
     """
     Load retro computing anniversaries and events from the retro_days.json configuration file.
@@ -77,6 +94,7 @@ def load_retro_events(year: int) -> dict:
     return update_year_key(year,load_json_cached(resolve_config_path('retro_days.json')))
 
 
+@lru_cache(maxsize=32)
 def load_uk_events(year: int) -> dict:
     """
     Load UK-specific public holidays from the uk_holidays.json configuration file.
@@ -88,6 +106,7 @@ def load_uk_events(year: int) -> dict:
     return update_year_key(year,load_json_cached(resolve_config_path('uk_events.json')))
 
 
+@lru_cache(maxsize=32)
 def load_custom_events(year: int) -> dict:
     """
     Load user-defined custom events from the custom_events.json configuration file.
@@ -98,6 +117,7 @@ def load_custom_events(year: int) -> dict:
     """
     return update_year_key(year,load_json_cached(resolve_config_path('custom_events.json')))
 
+@lru_cache(maxsize=32)
 def load_cultural_events(year: int) -> dict:
     """
     Load cultural observance events for the given year from JSON file.
@@ -128,16 +148,14 @@ def load_cultural_events(year: int) -> dict:
     # Load raw JSON file
     data = load_json_cached(resolve_config_path('cultural_days.json'))
 
-    result = {}
+    result = defaultdict(lambda: {"entries": []})
 
     # Process both country-specific and global 'ALL' entries
     for region_key, entries in data.items():
         for mmdd, event in entries.items():
-            full_date = f"{year}-{mmdd}"
-            result.setdefault(full_date, {"entries": []})
-            result[full_date]["entries"].append({
+            result[f"{year}-{mmdd}"]["entries"].append({
                 "label": event["label"],
                 "colour": event["colour"]
             })
 
-    return result
+    return dict(result)
@@ -6,13 +6,26 @@ from supplied artwork and SVG calendar pages.
 """
 import os
 import shutil
-import cairosvg
+import hashlib
+import logging
+import threading
+import multiprocessing
+from io import BytesIO
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+# cairosvg, reportlab's canvas/ImageReader and PIL are imported where they are
+# used, so each export path (and each raster worker) only loads what it needs
 from reportlab.lib.pagesizes import A4, landscape
-from reportlab.pdfgen import canvas
-from reportlab.lib.utils import ImageReader
-from PIL import Image
 from modules.helpers import open_file_or_folder
 
+log = logging.getLogger(__name__)
+
+# Name of the per-document form XObject holding the branding footer
+BRANDING_FORM = "branding"
+
+# Non-JPEG artwork larger than this is re-encoded as JPEG for the PDF
+PDF_JPEG_MIN_BYTES = 512 * 1024
+
 def ensure_dir_exists(path):
     """
     Ensure that the specified directory exists, creating it if necessary.
@@ -27,31 +40,138 @@ def ensure_dir_exists(path):
 
 def cleanup_temp_files(temp_files, temp_dir, enable_cleanup=True):
     """
-    Delete all files in `temp_files` and then attempt to remove `temp_dir`.
+    Remove the temporary directory `temp_dir` and everything in it.
+
+    Removal runs on a background thread so the caller can carry on (e.g. open the
+    output folder) straight away; the interpreter still waits for it before exit.
 
     Args:
-        temp_files (list): List of file paths to remove.
-        temp_dir (str): Path to directory to remove after files are deleted.
+        temp_files (list): Files inside `temp_dir`; kept for compatibility, as
+            removing the directory already deletes them.
+        temp_dir (str): Path to directory to remove.
         enable_cleanup (bool): Whether to actually perform cleanup.
 
     Returns:
         None
     """
     if not enable_cleanup:
-        print("Cleanup skipped (set 'cleanup': true in settings.json to enable).\n")
+        log.info("Cleanup skipped (set 'cleanup': true in settings.json to enable).\n")
         return
 
-    print("Cleaning up temporary PNG files...\n\n")
-    for path in temp_files:
-        try:
-            os.remove(path)
-        except Exception as e:
-            print(f"Warning: Could not remove temp file {path}: {e}\n")
+    log.info("Cleaning up temporary PNG files...\n\n")
+    threading.Thread(target=_remove_temp_dir, args=(temp_dir,)).start()
 
+def _remove_temp_dir(temp_dir):
+    """Thread target for cleanup_temp_files: remove a directory tree, warning on failure."""
     try:
         shutil.rmtree(temp_dir)
     except Exception as e:
-        print(f"Warning: Could not remove temp directory {temp_dir}: {e}\n")
+        log.warning(f"Warning: Could not remove temp directory {temp_dir}: {e}\n")
+
+def link_or_copy(src, dst):
+    """
+    Hard-link src to dst, falling back to a plain copy (e.g. across filesystems).
+
+    Only use for files nothing else writes to afterwards, such as temp renders:
+    a hard link shares its contents with the source.
+
+    Args:
+        src (str): Existing file.
+        dst (str): Destination path; replaced if it already exists.
+
+    Returns:
+        None
+    """
+    try:
+        if os.path.lexists(dst):
+            os.remove(dst)
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def kernel_copy(src, dst):
+    """
+    Copy src to dst inside the kernel with os.copy_file_range.
+
+    On copy-on-write filesystems such as Btrfs or XFS this shares the data
+    blocks instead of copying them. Platforms or filesystems without support
+    fall back to shutil.copyfile.
+
+    Args:
+        src (str): Existing file.
+        dst (str): Destination path; overwritten if it already exists.
+
+    Returns:
+        None
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copyfile(src, dst)
+        return
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                pass
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def list_artwork(artwork_folder):
+    """
+    List the artwork folder once so per-page existence checks avoid a stat each.
+
+    Args:
+        artwork_folder (str): Folder holding the cover and monthly artwork.
+
+    Returns:
+        set: File names in the folder (empty if it cannot be read).
+    """
+    try:
+        return set(os.listdir(artwork_folder))
+    except OSError:
+        return set()
+
+def artwork_exists(artwork_names, artwork_folder, name):
+    """
+    Return True if an artwork file exists, using a listing from list_artwork().
+
+    Names not in the listing (nested paths, case-insensitive filesystems) still
+    fall back to os.path.exists, so the result matches a direct check.
+    """
+    return name in artwork_names or os.path.exists(os.path.join(artwork_folder, name))
+
+def export_io_pool():
+    """
+    Thread pool for export file copies and image encoding.
+
+    Both spend their time in I/O or in C code that releases the GIL, so threads
+    overlap them well; CPU-bound SVG rasterising uses rasterise_months instead.
+    """
+    return ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 2))
+
+def finish_export_jobs(pool, jobs):
+    """Wait for every job queued on an export_io_pool and re-raise the first failure."""
+    pool.shutdown(wait=True)
+    for job in jobs:
+        job.result()
+
+def _link_rendered_png(png_future, tmp_png, out_png):
+    """Export job: wait for a month's rasterised PNG, then link it into place."""
+    png_future.result()
+    link_or_copy(tmp_png, out_png)
+
+def wait_for_svg(svg_futures, month):
+    """
+    Block until a month's SVG has been written, if it is still being generated.
+
+    Args:
+        svg_futures (dict or None): {month: Future} from generate_all_svgs, or None
+            when compiling from SVG files already on disk.
+        month (int): The month (1-12) about to be read.
+
+    Returns:
+        None
+    """
+    if svg_futures and month in svg_futures:
+        svg_futures[month].result()
 
 def add_page_number(pdf_canvas, page_width, page_height, number):
     """Add a page number at the bottom centre of the PDF page."""
@@ -73,12 +193,18 @@ def add_branding(pdf_canvas, page_width, page_height, branding_text, branding_ur
     Returns:
         None
     """
-    pdf_canvas.setFont("Helvetica", 8)
-    pdf_canvas.setFillColorRGB(0.5, 0.5, 0.5)  # Subtle grey
-    margin = 4
-    #pdf_canvas.drawCentredString(page_width//2, margin, branding_text["branding_text"])
-    pdf_canvas.drawString(margin*2, margin, branding_text)
-    pdf_canvas.drawRightString(page_width - margin, margin, branding_url)
+    # The footer is identical on every page, so it is drawn once into a form
+    # XObject and each page just references it
+    if not pdf_canvas.hasForm(BRANDING_FORM):
+        pdf_canvas.beginForm(BRANDING_FORM)
+        pdf_canvas.setFont("Helvetica", 8)
+        pdf_canvas.setFillColorRGB(0.5, 0.5, 0.5)  # Subtle grey
+        margin = 4
+        #pdf_canvas.drawCentredString(page_width//2, margin, branding_text["branding_text"])
+        pdf_canvas.drawString(margin*2, margin, branding_text)
+        pdf_canvas.drawRightString(page_width - margin, margin, branding_url)
+        pdf_canvas.endForm()
+    pdf_canvas.doForm(BRANDING_FORM)
 
 
 def add_extras(pdf_canvas, page_width, page_height, branding_parms, page_number):
@@ -106,46 +232,270 @@ def svg_to_png(svg_path, png_path, output_width=842, output_height=595):
     Returns:
         None
     """
+    import cairosvg
+
     cairosvg.svg2png(url=svg_path, write_to=png_path,
-                     output_width=3508, output_height=2480,
+                     output_width=output_width, output_height=output_height,
                      background_color='white')
 
+def svg_to_png_bytes(svg_path, output_width=842, output_height=595):
+    """
+    Convert an SVG file to PNG data in memory, with no temporary file.
+
+    Args:
+        svg_path (str): Path to the SVG file.
+        output_width (int): Target width in pixels.
+        output_height (int): Target height in pixels.
+
+    Returns:
+        bytes: The encoded PNG.
+    """
+    import cairosvg
+
+    return cairosvg.svg2png(url=svg_path,
+                            output_width=output_width, output_height=output_height,
+                            background_color='white')
+
+def raster_cache_path(svg_path, cache_dir, output_width=842, output_height=595):
+    """
+    Path of the cached PNG for an SVG rendered at a given size.
+
+    The key is a hash of the SVG content and the pixel size, so regenerating
+    an unchanged calendar page still hits the cache.
+    """
+    with open(svg_path, "rb") as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16)
+    digest.update(f"{output_width}x{output_height}".encode())
+    return os.path.join(cache_dir, f"{digest.hexdigest()}.png")
+
+def svg_to_png_cached(svg_path, png_path, cache_dir, output_width=842, output_height=595):
+    """
+    Convert an SVG to PNG, reusing an earlier render from the raster cache.
+
+    Args:
+        svg_path (str): Path to the SVG file.
+        png_path (str or None): Output path for the PNG file, or None to return the PNG data.
+        cache_dir (str): Directory holding cached renders.
+        output_width (int): Target width in pixels.
+        output_height (int): Target height in pixels.
+
+    Returns:
+        bytes or None: The encoded PNG when png_path is None.
+    """
+    cache_file = raster_cache_path(svg_path, cache_dir, output_width, output_height)
+    if os.path.exists(cache_file):
+        if png_path is None:
+            with open(cache_file, "rb") as f:
+                return f.read()
+    else:
+        png_data = svg_to_png_bytes(svg_path, output_width, output_height)
+        # Written under a temporary name first so a reader never sees a partial file
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            f.write(png_data)
+        os.replace(tmp_file, cache_file)
+        if png_path is None:
+            return png_data
+    # A copy, not a link: png_path may be linked into the export folder, and
+    # edits to an exported PNG must not alter the cached render
+    kernel_copy(cache_file, png_path)
+    return None
+
+def raster_size(settings):
+    """
+    Pixel size for rasterised calendar pages: A4 landscape at output.raster_dpi.
+
+    The default of 300 DPI gives 3508x2480, the resolution used for print.
+
+    Args:
+        settings (dict): Project settings.
+
+    Returns:
+        dict: output_width/output_height keyword arguments for svg_to_png.
+    """
+    dpi = settings.get("output", {}).get("raster_dpi", 300)
+    page_width, page_height = landscape(A4)
+    return {"output_width": round(page_width * dpi / 72),
+            "output_height": round(page_height * dpi / 72)}
+
+def _raster_mp_context():
+    """
+    Start method for the rasterising process pool.
+
+    The pool is created while other threads are running (the SVG generation
+    pool's manager, export I/O threads), and forking a process with live
+    threads can deadlock the child on a lock held at fork time. forkserver
+    avoids that where available; elsewhere (Windows) spawn is used.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+def rasterise_months(year, svg_dir, svg_futures=None, png_dir=None, png_name=None, cache_dir=None, **size):
+    """
+    Convert every month's calendar SVG to PNG in parallel on a process pool.
+
+    Each month is submitted as soon as its SVG is ready, so early months are
+    rasterised while later SVGs are still being generated. The pool is shut down
+    without waiting; the returned futures complete in the background.
+
+    Args:
+        year (int): Calendar year.
+        svg_dir (str): Directory holding the CalYYYYMM.svg files.
+        svg_futures (dict, optional): {month: Future} for SVGs still being generated.
+        png_dir (str, optional): Directory to write the PNGs to. If omitted, each
+            future returns the PNG bytes instead of writing a file.
+        png_name (str, optional): PNG filename pattern, formatted with year and month.
+        cache_dir (str, optional): Raster cache directory; unchanged SVGs reuse
+            their earlier render instead of being converted again.
+        **size: output_width/output_height passed through to the converter.
+
+    Returns:
+        dict: {month: (png_path, Future)} for each month whose SVG exists;
+            png_path is None for in-memory conversion.
+    """
+    png_futures = {}
+    if cache_dir:
+        ensure_dir_exists(cache_dir)
+    executor = ProcessPoolExecutor(max_workers=min(12, os.cpu_count() or 1),
+                                   mp_context=_raster_mp_context())
+    try:
+        for month in range(1, 13):
+            svg_path = os.path.join(svg_dir, f"Cal{year}{month:02d}.svg")
+            wait_for_svg(svg_futures, month)
+            if not os.path.exists(svg_path):
+                continue
+            png_path = None
+            if png_dir is not None:
+                png_path = os.path.join(png_dir, png_name.format(year=year, month=month))
+            if cache_dir:
+                future = executor.submit(svg_to_png_cached, svg_path, png_path, cache_dir, **size)
+            elif png_path is None:
+                future = executor.submit(svg_to_png_bytes, svg_path, **size)
+            else:
+                future = executor.submit(svg_to_png, svg_path, png_path, **size)
+            png_futures[month] = (png_path, future)
+    finally:
+        executor.shutdown(wait=False)
+    return png_futures
+
+def _image_reader(image_path, jpeg_quality=None):
+    """
+    Return a new ImageReader for an artwork file.
+
+    Readers are not cached: once decoded they hold a full page of pixels, so
+    each is dropped as soon as its page is drawn. Artwork reused across pages
+    is still embedded once, as ReportLab names image XObjects by content.
+
+    With jpeg_quality set, large photographic (RGB/RGBA) artwork is re-encoded
+    as JPEG, which ReportLab embeds as-is instead of as Flate-compressed pixels.
+    The source is kept if the JPEG would not be smaller.
+    """
+    from reportlab.lib.utils import ImageReader
+
+    source_size = os.path.getsize(image_path)
+    if jpeg_quality and source_size > PDF_JPEG_MIN_BYTES:
+        from PIL import Image
+
+        with Image.open(image_path) as im:
+            if im.format != 'JPEG' and im.mode in ('RGB', 'RGBA'):
+                jpeg_data = BytesIO()
+                im.convert('RGB').save(jpeg_data, 'JPEG', quality=jpeg_quality)
+                if jpeg_data.tell() < source_size:
+                    jpeg_data.seek(0)
+                    return ImageReader(jpeg_data)
+    return ImageReader(image_path)
+
+def _decode_page(image, jpeg_quality=None):
+    """
+    Export job: decode a page image ready for drawing on the PDF canvas.
+
+    Args:
+        image (str or Future): Artwork path, or a rasterise_months Future of PNG bytes.
+        jpeg_quality (int, optional): Re-encode large photographic artwork as JPEG
+            at this quality (see _image_reader). Not applied to calendar pages.
+
+    Returns:
+        ImageReader: Reader whose pixel data has already been unpacked; the
+            caller should drop it once the page is drawn.
+    """
+    from reportlab.lib.utils import ImageReader
+
+    if isinstance(image, str):
+        reader = _image_reader(image, jpeg_quality)
+    else:
+        reader = ImageReader(BytesIO(image.result()))
+    reader.getRGBData()
+    return reader
+
+def decode_ahead(pool, images, ahead=2, jpeg_quality=None):
+    """
+    Yield decoded pages in order, keeping a few decodes running ahead.
+
+    Artwork and calendar pages go through the same queue in page order, so
+    bounding the look-ahead keeps only a handful of full-size pages in
+    memory while the canvas embeds the current one.
+
+    Args:
+        pool (ThreadPoolExecutor): Pool to decode on, e.g. from export_io_pool.
+        images (iterable): Page images in page order: artwork paths, or
+            rasterise_months Futures of PNG bytes.
+        ahead (int): Number of pages to decode beyond the one being drawn.
+        jpeg_quality (int, optional): Passed to _decode_page for artwork.
+
+    Yields:
+        ImageReader: One decoded reader per image, in the order given.
+    """
+    pending = deque()
+    for image in images:
+        pending.append(pool.submit(_decode_page, image, jpeg_quality))
+        if len(pending) > ahead:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
 def add_image_to_canvas(pdf_canvas, image_path, page_width, page_height):
     """
     Draw a scaled image (PNG/JPG) centred on the PDF page.
 
     Args:
         pdf_canvas (canvas.Canvas): ReportLab canvas object.
-        image_path (str): Path to the image file.
+        image_path (str or ImageReader): Path to the image file, or an already open reader.
         page_width (float): Width of the PDF page.
         page_height (float): Height of the PDF page.
 
     Returns:
         None
     """
-    image = ImageReader(image_path)
+    from reportlab.lib.utils import ImageReader
+
+    image = image_path if isinstance(image_path, ImageReader) else _image_reader(image_path)
     iw, ih = image.getSize()
     scale = min(page_width / iw, page_height / ih)
-    new_w, new_h = iw * scale, ih * scale
-    x = (page_width - new_w) / 2
-    y = (page_height - new_h) / 2
-    pdf_canvas.setFillColorRGB(1, 1, 1)  # White
-    pdf_canvas.rect(0, 0, page_width, page_height, fill=1, stroke=0)
-    pdf_canvas.drawImage(image, x, y, width=new_w, height=new_h)
+    # Only letterboxed images need the white backdrop; full-page ones cover it
+    if iw * scale < page_width - 1 or ih * scale < page_height - 1:
+        pdf_canvas.setFillColorRGB(1, 1, 1)  # White
+        pdf_canvas.rect(0, 0, page_width, page_height, fill=1, stroke=0)
+    # ReportLab fits and centres the image within the page box
+    pdf_canvas.drawImage(image, 0, 0, width=page_width, height=page_height,
+                         preserveAspectRatio=True, anchor='c')
 
 
 
 
-def export_calendar_pdf(settings):
+def export_calendar_pdf(settings, svg_futures=None):
     """
     Export a full calendar as a compiled PDF (A4 landscape) with art and calendar pages.
 
     Args:
         settings (dict): Project settings, including 'art_files' and 'output'.
+        svg_futures (dict, optional): {month: Future} for SVGs still being generated.
 
     Returns:
         None
     """
+    from reportlab.pdfgen import canvas
+
     page_width, page_height = landscape(A4)
 
     # Get all relevant paths from settings
@@ -154,6 +504,7 @@ def export_calendar_pdf(settings):
     front_cover = art.get('front_cover')
     back_cover = art.get('back_cover')
     monthly_art = art.get('monthly_spreads', [])
+    artwork_names = list_artwork(artwork_folder)
 
     output_settings = settings.get("output", {})
     svg_dir = output_settings.get("svg_dir", "./calendars")
@@ -163,82 +514,100 @@ def export_calendar_pdf(settings):
     year = int(settings.get("year"))
     months = list(range(1, 13))
 
-    # Prepare temp PNG directory for converted SVGs
-    tmp_png_dir = os.path.join(output_dir, "tmp_pngs")
-    ensure_dir_exists(tmp_png_dir)
     ensure_dir_exists(output_dir)
-    temp_pngs = []
     branding = settings.get("branding", {})
 
-    print(f"Compiling Calender PDF for {year}")
-    print("="*31)
-    print()
+    log.info(f"Compiling Calender PDF for {year}")
+    log.info("="*31)
+    log.info("")
 
     c = canvas.Canvas(output_pdf_path, pagesize=landscape(A4))
 
     page_number = 1
     missing_files = []
 
+    # Paths and artwork checks used by the page loop are done once up front
+    front_cover_path = os.path.join(artwork_folder, front_cover) if front_cover else None
+    front_cover_found = bool(front_cover) and artwork_exists(artwork_names, artwork_folder, front_cover)
+    month_art_paths = [os.path.join(artwork_folder, name) for name in monthly_art[:len(months)]]
+    month_art_found = [artwork_exists(artwork_names, artwork_folder, name) for name in monthly_art[:len(months)]]
+    back_cover_path = os.path.join(artwork_folder, back_cover) if back_cover else None
+    back_cover_found = bool(back_cover) and artwork_exists(artwork_names, artwork_folder, back_cover)
+    svg_paths = [os.path.join(svg_dir, f"Cal{year}{month:02d}.svg") for month in months]
+
+    # Calendar pages are rasterised in memory; nothing is written to disk
+    png_futures = rasterise_months(year, svg_dir, svg_futures,
+                                   cache_dir=output_settings.get("raster_cache_dir"),
+                                   **raster_size(settings))
+
+    # Every page image, in the order the loop below draws them
+    page_images = [front_cover_path] if front_cover_found else []
+    for i, month in enumerate(months):
+        if i < len(month_art_paths) and month_art_found[i]:
+            page_images.append(month_art_paths[i])
+        if month in png_futures:
+            page_images.append(png_futures[month][1])
+    if back_cover_found:
+        page_images.append(back_cover_path)
+
+    # Pages are decoded in parallel a few ahead of the single canvas, which
+    # then only has to embed them in order
+    pool = export_io_pool()
+    art_quality = output_settings.get("pdf_art_jpeg_quality", 90)
+    pages = decode_ahead(pool, page_images, jpeg_quality=art_quality)
+
     # --- Front Cover ---
     if front_cover:
-        front_cover_path = os.path.join(artwork_folder, front_cover)
-        if os.path.exists(front_cover_path):
-            print(f"Adding the Front Cover: {front_cover_path}\n")
-            add_image_to_canvas(c, front_cover_path, page_width, page_height)
+        if front_cover_found:
+            log.info(f"Adding the Front Cover: {front_cover_path}\n")
+            add_image_to_canvas(c, next(pages), page_width, page_height)
             #add_branding(c,page_width, page_height,branding)
             c.showPage()
         else:
             missing_files.append(front_cover_path)
-            print(f"*** WARNING: Unable to find Front Cover Image: {front_cover_path}")
+            log.warning(f"*** WARNING: Unable to find Front Cover Image: {front_cover_path}")
 
     # --- Month Pages ---
-    for i, month in enumerate(months):
+    for i, (month, svg_path) in enumerate(zip(months, svg_paths)):
         # Monthly art
-        if i < len(monthly_art):
-            month_art_path = os.path.join(artwork_folder, monthly_art[i])
-            if os.path.exists(month_art_path):
-                print(f"  Adding Month Artwork: {month_art_path}")
-                add_image_to_canvas(c, month_art_path, page_width, page_height)
+        if i < len(month_art_paths):
+            month_art_path = month_art_paths[i]
+            if month_art_found[i]:
+                log.info(f"  Adding Month Artwork: {month_art_path}")
+                add_image_to_canvas(c, next(pages), page_width, page_height)
                 #add_branding(c,page_width, page_height,branding)
                 c.showPage()
                 page_number += 1
             else:
                 missing_files.append(month_art_path)
-                print(f"*** WARNING: Unable to find artwork: {month_art_path}")
+                log.warning(f"*** WARNING: Unable to find artwork: {month_art_path}")
         # Calendar SVG (convert to PNG)
-        svg_filename = f"Cal{year}{month:02d}.svg"
-        svg_path = os.path.join(svg_dir, svg_filename)
-        png_filename = f"Cal{year}{month:02d}.png"
-        png_path = os.path.join(tmp_png_dir, png_filename)
-        if os.path.exists(svg_path):
-            print(f" Adding Month Calendar: {svg_path}\n")
-            svg_to_png(svg_path, png_path,
-                       output_width=int(page_width),
-                       output_height=int(page_height))
-            temp_pngs.append(png_path)
-            add_image_to_canvas(c, png_path, page_width, page_height)
+        if month in png_futures:
+            log.info(f" Adding Month Calendar: {svg_path}\n")
+            add_image_to_canvas(c, next(pages), page_width, page_height)
             page_number += 1
             add_extras(c,page_width, page_height,branding, page_number)
             #add_branding(c,page_width, page_height,branding)
             #c.showPage()
         else:
             missing_files.append(svg_path)
-            print(f"*** WARNING: Unable to find Calendar: {svg_path}")
+            log.warning(f"*** WARNING: Unable to find Calendar: {svg_path}")
 
 
     # --- Back Cover ---
     if back_cover:
-        back_cover_path = os.path.join(artwork_folder, back_cover)
-        if os.path.exists(back_cover_path):
-            print(f" Adding the Back Cover: {back_cover_path}\n")
-            add_image_to_canvas(c, back_cover_path, page_width, page_height)
+        if back_cover_found:
+            log.info(f" Adding the Back Cover: {back_cover_path}\n")
+            add_image_to_canvas(c, next(pages), page_width, page_height)
             #add_branding(c,page_width, page_height,branding)
             page_number += 1
             add_extras(c,page_width, page_height,branding, page_number)
             #c.showPage()
         else:
             missing_files.append(back_cover_path)
-            print(f"*** WARNING: Unable to find Back Cover Image: {back_cover_path}")
+            log.warning(f"*** WARNING: Unable to find Back Cover Image: {back_cover_path}")
+
+    finish_export_jobs(pool, [])
 
     # --- Set Meta Data Baby Yeah! ----
     meta = settings.get("pdf_metadata", {})
@@ -251,30 +620,28 @@ def export_calendar_pdf(settings):
     c.setKeywords(meta.get("keywords", "calendar, svg, python"))
     c.setCreator("Calendar Generator by Jason Brooks, https://github.com/muckypaws/CalendarCompiler")
     c.save()
-    print(f" Compiled PDF saved to: {output_pdf_path}")
+    log.info(f" Compiled PDF saved to: {output_pdf_path}")
 
     if missing_files:
-        print(f"\n**** Warning: {len(missing_files)} missing files/artwork, file incomplete ****")
+        log.warning(f"\n**** Warning: {len(missing_files)} missing files/artwork, file incomplete ****")
         if missing_files:
-            print("\nSummary of missing files:")
+            log.warning("\nSummary of missing files:")
             for fname in missing_files:
-                print(f" - {fname}")
-            print()
-
-    # --- Cleanup section, if enabled in settings ---
-    cleanup_temp_files(temp_pngs, tmp_png_dir, enable_cleanup=art.get("cleanup", False))
+                log.warning(f" - {fname}")
+            log.warning("")
 
     if settings["OpenOnCompletion"]:
         open_file_or_folder(output_pdf_path)
 
 
 # --- Stubs for PNG/JPEG export to implement next ---
-def export_calendar_pngs(settings):
+def export_calendar_pngs(settings, svg_futures=None):
     """
     Export each calendar page and artwork as individual PNG files.
 
     Args:
         settings (dict): Project settings, including 'art_files' and 'output'.
+        svg_futures (dict, optional): {month: Future} for SVGs still being generated.
 
     Returns:
         None
@@ -284,6 +651,7 @@ def export_calendar_pngs(settings):
     front_cover = art.get('front_cover')
     back_cover = art.get('back_cover')
     monthly_art = art.get('monthly_spreads', [])
+    artwork_names = list_artwork(artwork_folder)
 
     output_settings = settings.get("output", {})
     svg_dir = output_settings.get("svg_dir", "./calendars")
@@ -296,19 +664,26 @@ def export_calendar_pngs(settings):
     ensure_dir_exists(tmp_png_dir)
     temp_pngs = []
 
-    print(f"Creating Calender PNGs for {year}")
-    print("="*31)
-    print()
+    log.info(f"Creating Calender PNGs for {year}")
+    log.info("="*31)
+    log.info("")
+
+    # Raster workers are started before the I/O threads below exist
+    png_futures = rasterise_months(year, svg_dir, svg_futures, tmp_png_dir, "calendar_{month:02d}.png",
+                                   cache_dir=output_settings.get("raster_cache_dir"),
+                                   **raster_size(settings))
+    pool = export_io_pool()
+    jobs = []
 
     # --- Front Cover ---
     if front_cover:
         src_path = os.path.join(artwork_folder, front_cover)
         out_path = os.path.join(output_dir, "cover_front.png")
-        if os.path.exists(src_path):
-            print(f"Exporting Front Cover PNG: {out_path}")
-            shutil.copy(src_path, out_path)
+        if artwork_exists(artwork_names, artwork_folder, front_cover):
+            log.info(f"Exporting Front Cover PNG: {out_path}")
+            jobs.append(pool.submit(kernel_copy, src_path, out_path))
         else:
-            print(f"*** WARNING: Unable to find Front Cover Image: {src_path}")
+            log.warning(f"*** WARNING: Unable to find Front Cover Image: {src_path}")
 
     # --- Month Pages ---
     for i, month in enumerate(months):
@@ -316,34 +691,35 @@ def export_calendar_pngs(settings):
         if i < len(monthly_art):
             src_path = os.path.join(artwork_folder, monthly_art[i])
             out_path = os.path.join(output_dir, f"art_{month:02d}.png")
-            if os.path.exists(src_path):
-                print(f"  Exporting Month Artwork: {out_path}")
-                shutil.copy(src_path, out_path)
+            if artwork_exists(artwork_names, artwork_folder, monthly_art[i]):
+                log.info(f"  Exporting Month Artwork: {out_path}")
+                jobs.append(pool.submit(kernel_copy, src_path, out_path))
             else:
-                print(f"*** WARNING: Unable to find artwork: {src_path}")
+                log.warning(f"*** WARNING: Unable to find artwork: {src_path}")
 
         # Calendar SVG (convert to PNG)
         svg_filename = f"Cal{year}{month:02d}.svg"
         svg_path = os.path.join(svg_dir, svg_filename)
         out_png = os.path.join(output_dir, f"calendar_{month:02d}.png")
-        tmp_png = os.path.join(tmp_png_dir, f"calendar_{month:02d}.png")
-        if os.path.exists(svg_path):
-            print(f"  Exporting Month Calendar PNG: {out_png}")
-            svg_to_png(svg_path, tmp_png)
-            shutil.copy(tmp_png, out_png)
+        if month in png_futures:
+            log.info(f"  Exporting Month Calendar PNG: {out_png}")
+            tmp_png, png_future = png_futures[month]
+            jobs.append(pool.submit(_link_rendered_png, png_future, tmp_png, out_png))
             temp_pngs.append(tmp_png)
         else:
-            print(f"*** WARNING: Unable to find Calendar: {svg_path}")
+            log.warning(f"*** WARNING: Unable to find Calendar: {svg_path}")
 
     # --- Back Cover ---
     if back_cover:
         src_path = os.path.join(artwork_folder, back_cover)
         out_path = os.path.join(output_dir, "cover_back.png")
-        if os.path.exists(src_path):
-            print(f"Exporting Back Cover PNG: {out_path}")
-            shutil.copy(src_path, out_path)
+        if artwork_exists(artwork_names, artwork_folder, back_cover):
+            log.info(f"Exporting Back Cover PNG: {out_path}")
+            jobs.append(pool.submit(kernel_copy, src_path, out_path))
         else:
-            print(f"*** WARNING: Unable to find Back Cover Image: {src_path}")
+            log.warning(f"*** WARNING: Unable to find Back Cover Image: {src_path}")
+
+    finish_export_jobs(pool, jobs)
 
     # --- Cleanup temporary PNGs, if enabled ---
     cleanup_temp_files(temp_pngs, tmp_png_dir, enable_cleanup=art.get("cleanup", False))
@@ -351,12 +727,13 @@ def export_calendar_pngs(settings):
     if settings["OpenOnCompletion"]:
         open_file_or_folder(output_dir)
 
-def export_calendar_jpgs(settings):
+def export_calendar_jpgs(settings, svg_futures=None):
     """
     Export each calendar page and artwork as individual JPG files.
 
     Args:
         settings (dict): Project settings, including 'art_files' and 'output'.
+        svg_futures (dict, optional): {month: Future} for SVGs still being generated.
 
     Returns:
         None
@@ -366,6 +743,7 @@ def export_calendar_jpgs(settings):
     front_cover = art.get('front_cover')
     back_cover = art.get('back_cover')
     monthly_art = art.get('monthly_spreads', [])
+    artwork_names = list_artwork(artwork_folder)
 
     output_settings = settings.get("output", {})
     svg_dir = output_settings.get("svg_dir", "./calendars")
@@ -374,29 +752,57 @@ def export_calendar_jpgs(settings):
     months = list(range(1, 13))
 
     ensure_dir_exists(output_dir)
-    tmp_png_dir = os.path.join(output_dir, "tmp_pngs")
-    ensure_dir_exists(tmp_png_dir)
-    temp_pngs = []
 
-    print(f"Compiling Calender JPGs for {year}")
-    print("="*32)
-    print()
+    log.info(f"Compiling Calender JPGs for {year}")
+    log.info("="*32)
+    log.info("")
+
+    # Print-resolution box that oversized artwork is reduced to fit
+    size = raster_size(settings)
+    target = (size["output_width"], size["output_height"])
+
+    # Calendar pages are rasterised in memory and encoded straight to JPG; the
+    # raster workers are started before the I/O threads below exist
+    png_futures = rasterise_months(year, svg_dir, svg_futures,
+                                   cache_dir=output_settings.get("raster_cache_dir"), **size)
+    pool = export_io_pool()
+    jobs = []
 
     # --- Helper to convert and save JPG ---
     def png_to_jpg(png_path, jpg_path):
+        from PIL import Image
+
+        # png_path may also be a file-like object holding the image data
         with Image.open(png_path) as im:
-            rgb_im = im.convert('RGB')
+            # Artwork at least twice print resolution is shrunk to fit before encoding;
+            # thumbnail() uses draft() so JPEG sources are downscaled while decoding
+            if min(target[0] / im.width, target[1] / im.height) <= 0.5:
+                im.thumbnail(target, Image.Resampling.LANCZOS)
+            if im.mode == 'P' and 'transparency' in im.info:
+                im = im.convert('RGBA')
+            # Opaque RGB sources are encoded as-is rather than via a full-size copy;
+            # transparent ones are flattened onto white in a single paste
+            if im.mode == 'RGB':
+                rgb_im = im
+            elif im.mode in ('RGBA', 'LA'):
+                rgb_im = Image.new('RGB', im.size, 'white')
+                rgb_im.paste(im, mask=im)
+            else:
+                rgb_im = im.convert('RGB')
             rgb_im.save(jpg_path, quality=95)
 
+    def page_to_jpg(png_future, jpg_path):
+        png_to_jpg(BytesIO(png_future.result()), jpg_path)
+
     # --- Front Cover ---
     if front_cover:
         src_path = os.path.join(artwork_folder, front_cover)
         out_path = os.path.join(output_dir, "cover_front.jpg")
-        if os.path.exists(src_path):
-            print(f"Exporting Front Cover JPG: {out_path}")
-            png_to_jpg(src_path, out_path)
+        if artwork_exists(artwork_names, artwork_folder, front_cover):
+            log.info(f"Exporting Front Cover JPG: {out_path}")
+            jobs.append(pool.submit(png_to_jpg, src_path, out_path))
         else:
-            print(f"*** WARNING: Unable to find Front Cover Image: {src_path}")
+            log.warning(f"*** WARNING: Unable to find Front Cover Image: {src_path}")
 
     # --- Month Pages ---
     for i, month in enumerate(months):
@@ -404,37 +810,33 @@ def export_calendar_jpgs(settings):
         if i < len(monthly_art):
             src_path = os.path.join(artwork_folder, monthly_art[i])
             out_path = os.path.join(output_dir, f"art_{month:02d}.jpg")
-            if os.path.exists(src_path):
-                print(f"  Exporting Month Artwork JPG: {out_path}")
-                png_to_jpg(src_path, out_path)
+            if artwork_exists(artwork_names, artwork_folder, monthly_art[i]):
+                log.info(f"  Exporting Month Artwork JPG: {out_path}")
+                jobs.append(pool.submit(png_to_jpg, src_path, out_path))
             else:
-                print(f"*** WARNING: Unable to find artwork: {src_path}")
+                log.warning(f"*** WARNING: Unable to find artwork: {src_path}")
 
         # Calendar SVG (convert to PNG, then to JPG)
         svg_filename = f"Cal{year}{month:02d}.svg"
         svg_path = os.path.join(svg_dir, svg_filename)
-        tmp_png = os.path.join(tmp_png_dir, f"calendar_{month:02d}.png")
         out_jpg = os.path.join(output_dir, f"calendar_{month:02d}.jpg")
-        if os.path.exists(svg_path):
-            print(f"  Exporting Month Calendar JPG: {out_jpg}")
-            svg_to_png(svg_path, tmp_png)
-            png_to_jpg(tmp_png, out_jpg)
-            temp_pngs.append(tmp_png)
+        if month in png_futures:
+            log.info(f"  Exporting Month Calendar JPG: {out_jpg}")
+            jobs.append(pool.submit(page_to_jpg, png_futures[month][1], out_jpg))
         else:
-            print(f"*** WARNING: Unable to find Calendar: {svg_path}")
+            log.warning(f"*** WARNING: Unable to find Calendar: {svg_path}")
 
     # --- Back Cover ---
     if back_cover:
         src_path = os.path.join(artwork_folder, back_cover)
         out_path = os.path.join(output_dir, "cover_back.jpg")
-        if os.path.exists(src_path):
-            print(f"Exporting Back Cover JPG: {out_path}")
-            png_to_jpg(src_path, out_path)
+        if artwork_exists(artwork_names, artwork_folder, back_cover):
+            log.info(f"Exporting Back Cover JPG: {out_path}")
+            jobs.append(pool.submit(png_to_jpg, src_path, out_path))
         else:
-            print(f"*** WARNING: Unable to find Back Cover Image: {src_path}")
+            log.warning(f"*** WARNING: Unable to find Back Cover Image: {src_path}")
 
-    # --- Cleanup temporary PNGs, if enabled ---
-    cleanup_temp_files(temp_pngs, tmp_png_dir, enable_cleanup=art.get("cleanup", False))
+    finish_export_jobs(pool, jobs)
 
     if settings["OpenOnCompletion"]:
         open_file_or_folder(output_dir)
@@ -11,11 +11,24 @@ import re
 import calendar
 import textwrap
 import csv
+from functools import lru_cache
 from datetime import datetime
 from datetime import date, timedelta
-from dotenv import load_dotenv
 from modules.holiday_types import MultiColourHolidayDict
 
+try:
+    import orjson  # Optional: faster JSON parse/serialise
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: incremental JSON parser for large files
+except ImportError:
+    ijson = None
+
+# JSON files larger than this are parsed incrementally when ijson is installed
+JSON_STREAM_MIN_BYTES = 256 * 1024
+
 #try:
 #    from modules.holiday_types import MultiColourHolidayDict
 #except ModuleNotFoundError:
@@ -25,10 +38,16 @@ from modules.holiday_types import MultiColourHolidayDict
 #    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 #    from modules.holiday_types import MultiColourHolidayDict
 
-# Module-level variable to cache settings after first load
-_CACHED_SETTINGS = None
 _json_cache = {}
 
+# Patterns used by canonicalise_label, compiled once
+_RE_SAINT = re.compile(r"\bsaint\b")
+_RE_ST = re.compile(r"\bst\.?\b")
+_RE_PUNCT = re.compile(r"[^\w\s]")
+_RE_REDUNDANT = re.compile(r"\b(?:day|the|holiday|hol)\b")
+_RE_WS = re.compile(r"\s+")
+_APOSTROPHES = str.maketrans("", "", "’'")
+
 def get_api_key(settings=None, keyname="MY_API_KEY", env_path=".env"):
     """
     Retrieve API key, trying (in order):.
@@ -56,7 +75,9 @@ def get_api_key(settings=None, keyname="MY_API_KEY", env_path=".env"):
         if settings[settings_key] != "USE_ENVIRONMENT":
             return settings[settings_key]
 
-    # 2. Try .env file (uppercase key)
+    # 2. Try .env file (uppercase key); dotenv is only imported when needed
+    from dotenv import load_dotenv
+
     load_dotenv(env_path)
     env_val = os.getenv(env_keyname)
     if env_val:
@@ -105,10 +126,20 @@ def open_file_or_folder(path):
     else:
         print(f"Cannot open files on this OS: {sys.platform}")
 
+@lru_cache(maxsize=8)
+def _read_settings(settings_path, mtime_ns, size):
+    """Read and parse a settings file, memoised per path and file version."""
+    with open(settings_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 def load_settings(settings_path="./config/settings.json", force_reload=False):
     """
     Load (and cache) configuration parameters from a JSON file.
 
+    Results are memoised per settings path and revalidated against the file's
+    modification time and size, so repeated calls from any module share the
+    same dictionary until the file is edited.
+
     Args:
         settings_path (str): Path to the JSON config file.
         force_reload (bool): If True, re-read from disk even if cached.
@@ -120,18 +151,15 @@ def load_settings(settings_path="./config/settings.json", force_reload=False):
         FileNotFoundError: If the config file does not exist.
         json.JSONDecodeError: If the file is not valid JSON.
     """
-    global _CACHED_SETTINGS
-    if _CACHED_SETTINGS is not None and not force_reload:
-        return _CACHED_SETTINGS
+    if force_reload:
+        _read_settings.cache_clear()
 
-    if not os.path.exists(settings_path):
-        raise FileNotFoundError(f"Settings file '{settings_path}' not found.")
+    try:
+        st = os.stat(settings_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Settings file '{settings_path}' not found.") from None
 
-    with open(settings_path, "r", encoding="utf-8") as f:
-        settings = json.load(f)
-
-    _CACHED_SETTINGS = settings
-    return _CACHED_SETTINGS
+    return _read_settings(settings_path, st.st_mtime_ns, st.st_size)
 
 def remap_null_keys(data: dict, null_key: str = 'NATIONAL') -> dict:
     """
@@ -151,6 +179,8 @@ def save_json(data, file_path, pretty=True):
     """
     Save Python data as a JSON file.
 
+    Uses orjson when installed, falling back to the standard library json module.
+
     Parameters:
         data (dict or list): The data to serialize and write to file.
         file_path (str): The full path (including filename) to save the JSON output.
@@ -160,6 +190,12 @@ def save_json(data, file_path, pretty=True):
         OSError: If the file cannot be written.
     """
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+    if orjson is not None:
+        with open(file_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        return
+
     with open(file_path, "w", encoding="utf-8") as f:
         if pretty:
             json.dump(data, f, indent=2, ensure_ascii=False)
@@ -179,6 +215,10 @@ def load_json(file_path):
     """
     Load data from a JSON file.
 
+    Uses orjson when installed, falling back to the standard library json module.
+    Objects in files over JSON_STREAM_MIN_BYTES are streamed with ijson when it is
+    installed, so the raw file is never held in memory alongside the parsed data.
+
     Parameters:
         file_path (str): The full path to the JSON file to be loaded.
 
@@ -191,10 +231,82 @@ def load_json(file_path):
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"No such file: {file_path}")
+
+    if ijson is not None and os.path.getsize(file_path) > JSON_STREAM_MIN_BYTES:
+        data = _load_json_streamed(file_path)
+        if data is not None:
+            return data
+
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers are unaffected
+        with open(file_path, "rb") as f:
+            return orjson.loads(f.read())
+
     with open(file_path, "r", encoding="utf-8") as f:
         #print(f"Loading File: {file_path}")
         return json.load(f)
 
+def _load_json_streamed(file_path):
+    """
+    Parse a JSON object file key by key with ijson.
+
+    Returns None if the top-level value is not an object, so the caller can
+    fall back to a normal parse. ijson errors are re-raised as
+    json.JSONDecodeError to keep load_json's contract.
+    """
+    with open(file_path, "rb") as f:
+        if not f.read(64).lstrip().startswith(b"{"):
+            return None
+        f.seek(0)
+        try:
+            return dict(ijson.kvitems(f, "", use_float=True))
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), file_path, 0) from e
+
+def _holiday_entries(data: dict) -> list:
+    """Return the entries list for a date value, normalising the legacy single label/colour form."""
+    if "entries" not in data and "label" in data:
+        return [{"label": data["label"], "colour": data["colour"]}]
+    return data["entries"]
+
+def merge_holiday_sources(base: MultiColourHolidayDict, sources) -> None:
+    """
+    Merge several holiday sources into the base dictionary in a single pass.
+
+    Entries for each touched date are gathered across all sources first and then
+    deduplicated once, rather than regrouping the date after every source.
+    Labels keep first-seen order; a label seen with different colours becomes black.
+    Dates in base that no source touches are left exactly as they are.
+
+    Args:
+        base (MultiColourHolidayDict): Main holiday dataset (in-place modified).
+        sources (iterable): Holiday dictionaries to merge in, in priority order.
+    """
+    # Sources are often shared, cached loader results, so legacy label/colour
+    # values are converted as they are read rather than normalised in place
+    pending = {}
+    for additional in sources:
+        for date_key, data in additional.items():
+            entries = pending.get(date_key)
+            if entries is None:
+                existing = base.get(date_key)
+                entries = pending[date_key] = list(_holiday_entries(existing)) if existing else []
+            # Fast path for the entries format; only legacy values take the helper
+            new_entries = data.get("entries")
+            entries.extend(new_entries if new_entries is not None else _holiday_entries(data))
+
+    # Deduplicate by label and unify colours if mismatched
+    for date_key, entries in pending.items():
+        grouped = {}
+        for entry in entries:
+            colour = entry["colour"]
+            if grouped.setdefault(entry["label"], colour) != colour:
+                grouped[entry["label"]] = "black"
+
+        base[date_key] = {"entries": [
+            {"label": label, "colour": colour} for label, colour in grouped.items()
+        ]}
+
 def merge_holiday_data(base: MultiColourHolidayDict, additional: MultiColourHolidayDict) -> None:
     """
     Merge additional holiday data into the base dictionary.
@@ -205,35 +317,20 @@ def merge_holiday_data(base: MultiColourHolidayDict, additional: MultiColourHoli
         base (MultiColourHolidayDict): Main holiday dataset (in-place modified).
         additional (MultiColourHolidayDict): Additional data to merge in.
     """
-    for date_key, data in additional.items():
-        # --- Normalise additional input ---
-        if "entries" not in data and "label" in data and "colour" in data:
-            data = {"entries": [{"label": data["label"], "colour": data["colour"]}]}
-
-        # --- Normalise base input ---
-        if date_key not in base:
-            base[date_key] = data  # Safe to add directly now that additional is normalised
-            #continue
-        elif "entries" not in base[date_key] and "label" in base[date_key]:
-            legacy = base[date_key]
-            base[date_key] = {"entries": [{"label": legacy["label"], "colour": legacy["colour"]}]}
-
-        # Merge entries, deduplicate by label and unify colours if mismatched
-        all_entries = base[date_key]["entries"] + data["entries"]
-        grouped = {}
-        for entry in all_entries:
-            label = entry["label"]
-            grouped.setdefault(label, set()).add(entry["colour"])
+    merge_holiday_sources(base, (additional,))
 
-        base[date_key]["entries"] = [
-            {"label": label, "colour": "black" if len(colours) > 1 else list(colours)[0]}
-            for label, colours in grouped.items()
-        ]
+@lru_cache(maxsize=4096)
+def _wrap_cached(text, max_chars):
+    """Memoised textwrap.wrap, returned as a tuple so the cached value can't be mutated."""
+    return tuple(textwrap.wrap(text, width=max_chars))
 
 def wrap_text(text, max_chars=22):
     """
     Wrap a string into a list of lines, each with a maximum character count.
 
+    Results are memoised per (text, max_chars), since the same event labels
+    recur across cells and months.
+
     Args:
         text (str): The input string.
         max_chars (int): Approximate number of characters per line.
@@ -241,15 +338,17 @@ def wrap_text(text, max_chars=22):
     Returns:
         List[str]: Wrapped lines.
     """
-    return textwrap.wrap(text, width=max_chars)
+    return list(_wrap_cached(text, max_chars))
 
 
+@lru_cache(maxsize=4096)
 def canonicalise_label(label: str) -> str:
     """
     Convert a holiday or event label to a canonical (normalised) form for deduplication.
 
     Handles common abbreviation and variant cases, e.g. 'Saint' vs 'St', punctuation,
-    and British/American English differences.
+    and British/American English differences. Results are memoised, as the same
+    labels recur across dates, countries and sources.
 
     Args:
         label (str): The event or holiday label to normalise.
@@ -262,27 +361,42 @@ def canonicalise_label(label: str) -> str:
 
     # Replace common English holiday terms
     canon = canon.replace('&', 'and')
-    canon = re.sub(r"\bsaint\b", "St", canon)
-    canon = re.sub(r"\bst\.?\b", "St", canon)
+    canon = _RE_SAINT.sub("St", canon)
+    canon = _RE_ST.sub("St", canon)
     canon = canon.replace('shrove tuesday', 'Pancake Day')
     #canon = canon.replace('all hallows', 'All Saints')
 
     # Remove possessives and other punctuation
-    canon = re.sub(r"[’']", '', canon)        # Remove apostrophes/quotes
-    canon = re.sub(r"[^\w\s]", '', canon)     # Remove other punctuation
+    canon = canon.translate(_APOSTROPHES)     # Remove apostrophes/quotes
+    canon = _RE_PUNCT.sub('', canon)          # Remove other punctuation
 
-    # Remove redundant words
-    canon = re.sub(r"\bday\b", '', canon)
-    canon = re.sub(r"\bthe\b", '', canon)
-    canon = re.sub(r"\bholiday\b", '', canon)
-    canon = re.sub(r"\bhol\b", '', canon)
+    # Remove redundant words (day, the, holiday, hol) in one pass
+    canon = _RE_REDUNDANT.sub('', canon)
 
     # Normalise whitespace
-    canon = re.sub(r"\s+", " ", canon)
+    canon = _RE_WS.sub(" ", canon)
     canon = canon.strip()
 
     return canon
 
+def index_holidays_by_month(holiday_data: dict) -> dict:
+    """
+    Partition holiday data into per-month slices keyed by the 'YYYY-MM' date prefix.
+
+    Lets each month's renderer receive only the dates it can display rather than
+    the whole year's dataset.
+
+    Args:
+        holiday_data (dict): Holiday data keyed by 'YYYY-MM-DD' date strings.
+
+    Returns:
+        dict: {'YYYY-MM': {date_key: data, ...}} with dates in their original order.
+    """
+    by_month = {}
+    for date_key, data in holiday_data.items():
+        by_month.setdefault(date_key[:7], {})[date_key] = data
+    return by_month
+
 def trim_calendar_grid(grid, target_month):
     """
     Trim trailing rows from a full 6x7 calendar grid if they contain only days outside the target month.
@@ -335,21 +449,13 @@ def build_full_calendar_grid(year, month, week_start=0):
          (2026, 1, 1, True), (2026, 1, 2, True), (2026, 1, 3, True), (2026, 1, 4, True)]
     """
     cal = calendar.Calendar(firstweekday=week_start)
-    first_day_of_month = date(year, month, 1)
-    first_weekday = (first_day_of_month.weekday() - week_start) % 7
-    # Find first cell date (might be in prev month)
-    grid_start = first_day_of_month - timedelta(days=first_weekday)
-    grid = []
-    for i in range(6 * 7):
-        cell_date = grid_start + timedelta(days=i)
-        grid.append((
-            cell_date.year,
-            cell_date.month,
-            cell_date.day,
-            cell_date.month == month  # True if this cell is the actual month
-        ))
-    # Make it a list-of-lists (rows of 7)
-    return [grid[i*7:(i+1)*7] for i in range(6)]
+    # Whole weeks covering the month (4-6 of them), starting in the previous month if needed
+    weeks = cal.monthdatescalendar(year, month)
+    # Pad with following weeks so every grid has 6 rows
+    while len(weeks) < 6:
+        last_day = weeks[-1][-1]
+        weeks.append([last_day + timedelta(days=i) for i in range(1, 8)])
+    return [[(d.year, d.month, d.day, d.month == month) for d in week] for week in weeks]
 
 import csv
 import os
@@ -376,11 +482,12 @@ def export_holiday_validation_file(settings: dict, holiday_data: dict):
     with open(output_file, mode="w", encoding="utf-8", newline='') as f:
         writer = csv.writer(f, quoting=csv.QUOTE_ALL)
         writer.writerow(["Date", "Label", "Colour"])
-        for date_key in sorted(holiday_data.keys()):
-            entries = holiday_data[date_key].get("entries", [])
-            for entry in entries:
-                label = entry['label'].replace('\n', '; ')  # flatten embedded newlines
-                writer.writerow([date_key, label, entry['colour']])
+        # One writerows call over a generator; embedded newlines in labels are flattened
+        writer.writerows(
+            (date_key, entry['label'].replace('\n', '; '), entry['colour'])
+            for date_key, data in sorted(holiday_data.items())
+            for entry in data.get("entries", [])
+        )
 
     print(f"Holiday export file written: {output_file}")
 
@@ -397,15 +504,19 @@ def update_year_key(year, base):
         dict: New dictionary with valid 'YYYY-MM-DD' keys and event info as values.
               Invalid dates (e.g., Feb 29 in non-leap years) are skipped.
     """
-    events = {}
-    for mmdd, info in base.items():
-        date_str = f"{year}-{mmdd}"
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-            events[date_str] = info
-        except ValueError:
-            continue
-    return events
+    return {f"{year}-{mmdd}": info for mmdd, info in base.items() if _is_valid_mmdd(year, mmdd)}
+
+def _is_valid_mmdd(year, mmdd):
+    """Return True if 'MM-DD' names a real date in the given year."""
+    # Common case: plain two-digit month and day, checked without strptime
+    if len(mmdd) == 5 and mmdd.isascii() and mmdd[2] == "-" and mmdd[:2].isdigit() and mmdd[3:].isdigit():
+        month, day = int(mmdd[:2]), int(mmdd[3:])
+        return 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]
+    try:
+        datetime.strptime(f"{year}-{mmdd}", "%Y-%m-%d")
+    except ValueError:
+        return False
+    return True
 
 def resolve_config_path(filename: str) -> str:
     """
@@ -424,6 +535,8 @@ def merge_holiday_dicts(*dicts) -> dict:
     """
     Merge multiple holiday dictionaries into a single dictionary.
 
+    Later dicts overwrite earlier dicts on key conflict.
+
     Args:
         *dicts: Variable number of dict arguments.
 
@@ -15,9 +15,10 @@ def load_variable_rules() -> dict:
     Load country-specific variable holiday calculation rules from JSON file.
 
     Uses internal caching to avoid redundant file I/O on multiple calls.
+    Country codes are normalised to upper case once, at load time.
     
     Returns:
-        dict: Dictionary mapping country codes to rule sets.
+        dict: Dictionary mapping upper-case country codes to rule sets.
     """
     global _variable_rules_cache
     if _variable_rules_cache is not None:
@@ -27,7 +28,8 @@ def load_variable_rules() -> dict:
     full_path = os.path.join(base_dir, 'config', 'rules', 'variable_rules.json')
 
     try:
-        _variable_rules_cache = load_json(full_path)
+        rules = load_json(full_path)
+        _variable_rules_cache = {code.upper(): rule_set for code, rule_set in rules.items()}
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"Error loading rules: {e}")
         _variable_rules_cache = {}
@@ -1,6 +1,5 @@
 """Key Calendar Dates to Add, extend here for custom events."""
 import os
-import json
 from modules.helpers import (
     load_json,
     update_year_key,
@@ -20,8 +19,7 @@ def load_event_data(filename: str) -> dict:
     """
     config_path = os.path.join('config', filename)
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json(config_path)
     except FileNotFoundError:
         print(f"Warning: '{config_path}' not found. Returning empty dataset.")
         return {}
@@ -55,23 +53,6 @@ def retroevents(year: int):
 #    return update_year_key(year, load_event_data('international_day_of.json'))
 
 
-def merge_holiday_dicts(*dicts) -> dict:
-    """
-    Merge multiple holiday dictionaries into a single dictionary.
-
-    Later dicts overwrite earlier dicts on key conflict.
-
-    Args:
-        *dicts: Variable number of dict arguments.
-
-    Returns:
-        dict: Merged dictionary.
-    """
-    merged = {}
-    for d in dicts:
-        merged.update(d)
-    return merged
-
 def international_dates(year :int, include_official=True, include_semi=True, include_fun=True) -> dict:
     """
     Load and combine holiday event data based on user selection.
@@ -5,13 +5,18 @@ import math
 import xml.sax.saxutils as saxutils
 from datetime import datetime
 from modules.helpers import wrap_text, load_settings, trim_calendar_grid, build_full_calendar_grid
-from modules.calendar_events import ISO_COUNTRY_NAMES
+# calendar_events (and the holidays package behind it) is only needed for the
+# legend, so generate_legend_svg imports it; month render workers skip it
 
 def escape_xml(text):
     """Escape &, <, >, ', and " for XML."""
+    # Most labels contain none of the special characters; skip the replace passes
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
     return saxutils.escape(text)
 
-def generate_svg_calendar(year: int, month: int, output_dir="calendars", holidays: dict = None):
+def generate_svg_calendar(year: int, month: int, output_dir="calendars", holidays: dict = None,
+                          settings: dict = None):
     """
     Generate an A4 landscape SVG calendar for a given month and year.
 
@@ -30,11 +35,13 @@ def generate_svg_calendar(year: int, month: int, output_dir="calendars", holiday
             (e.g., '2026-03-17'), where each value is a dict with:
             - 'label': str – Displayed label for the event (can include newlines).
             - 'colour': str – Optional text colour (e.g., 'blue', 'red'). Defaults to black.
+        settings (dict, optional): Project settings. Loaded from settings.json if omitted.
 
     Returns:
         None. Outputs an SVG file to disk and prints the file path upon success.
     """
-    settings = load_settings()
+    if settings is None:
+        settings = load_settings()
 
     # A4 landscape size (SVG points)
     page_width = 842
@@ -105,6 +112,21 @@ def generate_svg_calendar(year: int, month: int, output_dir="calendars", holiday
     month_grid = build_full_calendar_grid(year, month, week_start=0)  # 0 for Monday
     month_grid = trim_calendar_grid(month_grid, month)
 
+    # Style settings used for every cell, looked up once
+    dn = settings["day_number"]
+    et = settings["event_text"]
+    day_num_default = dn["colour"]
+    invalid_fill = settings.get("invalid_cell_colour", "#dddddd")
+    weekend_colours = settings.get("weekend_colours", {})
+    saturday_fill = weekend_colours.get("saturday", "#d3f5ff")
+    sunday_fill = weekend_colours.get("sunday", "#d3f5ff")
+    # Attribute runs shared by every cell, formatted once
+    cell_size = f'width="{cell_width}" height="{cell_height}"'
+    day_num_style = f'font-size="{dn["fontsize"]}" font-family="{dn["font"]}" font-weight="{dn["weight"]}"'
+    event_style = f'font-size="{et["fontsize"]}" font-family="{et["font"]}" font-weight="{et["weight"]}"'
+    # Holiday keys for cells in this month differ only by day
+    date_prefix = f"{year}-{month:02d}-"
+
     for row_idx, week in enumerate(month_grid):
         for col_idx, (cell_year, cell_month, cell_day, in_current_month) in enumerate(week):
 
@@ -113,73 +135,67 @@ def generate_svg_calendar(year: int, month: int, output_dir="calendars", holiday
 
             # Dim or colour differently if not in current month
             if not in_current_month:
-                fill_colour = settings.get("invalid_cell_colour", "#dddddd")
+                fill_colour = invalid_fill
                 day_num_colour = "#888888"
             elif col_idx == 5:
-                fill_colour = settings.get("weekend_colours", {}).get("saturday", "#d3f5ff")
-                day_num_colour = settings["day_number"]["colour"]
+                fill_colour = saturday_fill
+                day_num_colour = day_num_default
             elif col_idx == 6:
-                fill_colour = settings.get("weekend_colours", {}).get("sunday", "#d3f5ff")
-                day_num_colour = settings["day_number"]["colour"]
+                fill_colour = sunday_fill
+                day_num_colour = day_num_default
             else:
                 fill_colour = "white"
-                day_num_colour = settings["day_number"]["colour"]
+                day_num_colour = day_num_default
 
-            svg.append(f'<rect x="{x}" y="{y_pos}" width="{cell_width}" height="{cell_height}" fill="{fill_colour}" stroke="black" />')
+            svg.append(f'<rect x="{x}" y="{y_pos}" {cell_size} fill="{fill_colour}" stroke="black" />')
 
             # Draw the day number for all boxes (including spillover days)
-            dn = settings["day_number"]
-            svg.append(
-                f'<text x="{x + cell_padding}" y="{y_pos + 16}" font-size="{dn["fontsize"]}" '
-                f'font-family="{dn["font"]}" font-weight="{dn["weight"]}" fill="{day_num_colour}">{cell_day}</text>'
-            )
-
-            # Only add holidays if this is the current month
-            date_key = f"{cell_year}-{cell_month:02d}-{cell_day:02d}"
-            if holidays and date_key in holidays and in_current_month:
-                entry_data = holidays[date_key]
+            text_x = x + cell_padding
+            svg.append(f'<text x="{text_x}" y="{y_pos + 16}" {day_num_style} fill="{day_num_colour}">{cell_day}</text>')
+
+            # Only add holidays if this is the current month; spillover cells skip the key lookup
+            entry_data = None
+            if holidays and in_current_month:
+                entry_data = holidays.get(f"{date_prefix}{cell_day:02d}")
+            if entry_data is not None:
                 line_offset = 0
 
-                if "entries" in entry_data:
-                    # New multi-entry format
-                    for entry in entry_data["entries"]:
-                        raw_lines = entry.get("label", "").split("\n")
-                        colour = entry.get("colour", "black")
-                        for raw in raw_lines:
-                            wrapped = wrap_text(raw, max_chars=max_chars_per_line)
-                            for line in wrapped:
-                                line_y = y_pos + 30 + (line_offset * 14)
-                                et = settings["event_text"]
-                                svg.append(
-                                    f'<text x="{x + cell_padding}" y="{line_y}" font-size="{et["fontsize"]}" '
-                                    f'font-family="{et["font"]}" font-weight="{et["weight"]}" fill="{colour}">{escape_xml(line)}</text>'
-                                )
-                                line_offset += 1
-                else:
-                    # Legacy single-entry fallback
-                    raw_lines = entry_data.get("label", "").split("\n")
-                    colour = entry_data.get("colour", "black")
+                # Legacy single-entry data is treated as a one-entry list
+                entries = entry_data["entries"] if "entries" in entry_data else (entry_data,)
+                for entry in entries:
+                    raw_lines = entry.get("label", "").split("\n")
+                    colour = entry.get("colour", "black")
                     for raw in raw_lines:
                         wrapped = wrap_text(raw, max_chars=max_chars_per_line)
                         for line in wrapped:
                             line_y = y_pos + 30 + (line_offset * 14)
-                            et = settings["event_text"]
                             svg.append(
-                                f'<text x="{x + cell_padding}" y="{line_y}" font-size="{et["fontsize"]}" '
-                                f'font-family="{et["font"]}" font-weight="{et["weight"]}" fill="{colour}">{escape_xml(line)}</text>'
+                                f'<text x="{text_x}" y="{line_y}" {event_style} fill="{colour}">{escape_xml(line)}</text>'
                             )
                             line_offset += 1
 
     svg.append('</g>')
     svg.append('</svg>')
 
-    with open(filepath, "w") as f:
-        f.write("\n".join(svg))
+    # Encoded once and written as bytes: no newline translation, and always UTF-8
+    with open(filepath, "wb") as f:
+        f.write("\n".join(svg).encode("utf-8"))
 
     print(f"Created: {filepath}")
 
+def _as_items(colours):
+    """Return (key, colour) pairs from either a dict or an existing sequence of pairs."""
+    return colours.items() if isinstance(colours, dict) else colours
+
 def generate_legend_svg(country_colours, event_types, output_path, num_cols=5, branding_text="Generated by Calendar Compiler | https://github.com/muckypaws/CalendarCompiler"):
-    """Generate a multi-column SVG legend/key showing country colours, event types, border, and branding."""
+    """
+    Generate a multi-column SVG legend/key showing country colours, event types, border, and branding.
+
+    country_colours and event_types may be dicts or precomputed sequences of
+    (key, colour) pairs, e.g. calendar_events.COUNTRY_COLOURS_ITEMS.
+    """
+    from modules.calendar_events import ISO_COUNTRY_NAMES
+
     width, height = 1400, 720  # Increased height for branding/footer
     margin_x = 60
     margin_y = 80
@@ -197,7 +213,7 @@ def generate_legend_svg(country_colours, event_types, output_path, num_cols=5, b
         # Section header
         f'<text x="{margin_x-10}" y="70" font-size="18" font-family="Arial" font-weight="bold">Countries:</text>'
     ]
-    countries = sorted(country_colours.items())
+    countries = sorted(_as_items(country_colours))
     rows_per_col = math.ceil(len(countries) / num_cols)
 
     for idx, (cc, colour) in enumerate(countries):
@@ -213,7 +229,7 @@ def generate_legend_svg(country_colours, event_types, output_path, num_cols=5, b
     if event_types:
         y_events = margin_y + (rows_per_col * row_height) + 40
         svg.append(f'<text x="{margin_x-10}" y="{y_events}" font-size="18" font-family="Arial" font-weight="bold">Event Types:</text>')
-        for idx, (label, colour) in enumerate(event_types.items()):
+        for idx, (label, colour) in enumerate(_as_items(event_types)):
             y_evt = y_events + 10 + idx * row_height
             svg.append(f'<rect x="{margin_x}" y="{y_evt}" width="20" height="20" fill="{colour}" stroke="black"/>')
             svg.append(f'<text x="{margin_x + 30}" y="{y_evt + 16}" font-size="16" font-family="Arial">{label}</text>')
@@ -7,12 +7,83 @@ and Christian moveable feasts (e.g. Easter, Pentecost, Advent).
 Author: Jason Brooks
 """
 
-from datetime import date, timedelta
+from datetime import date
+from functools import lru_cache, partial
 from modules.rules_loader import load_variable_rules
-from modules.event_loader import update_year_key
+
+# --- Event Labels ---
+# Only the date varies between years, so each event's label/colour value is
+# built once and shared; callers treat it as read-only
+
+_FLORII = {"label": "Florii (Flowers Day) (RO)", "colour": "mediumvioletred"}
+_VOLKSTRAUERTAG = {"label": "Volkstrauertag (Germany)", "colour": "black"}
+_REMEMBRANCE_SUNDAY = {"label": "Remembrance Sunday", "colour": "red"}
+_MOTHERS_DAY_UK = {"label": "Mother's Day (UK)", "colour": "pink"}
+_MOTHERS_DAY = {"label": "Mother's Day", "colour": "pink"}
+_FATHERS_DAY = {"label": "Father's Day", "colour": "blue"}
+_FATHERS_DAY_AU = {"label": "Father's Day (AU)", "colour": "blue"}
+_YORKSHIRE_PUDDING_DAY = {"label": "Yorkshire Pudding Day", "colour": "goldenrod"}
+_EASTER_SUNDAY = {"label": "Easter Sunday", "colour": "pink"}
+_GOOD_FRIDAY = {"label": "Good Friday", "colour": "red"}
+_ASH_WEDNESDAY = {"label": "Ash Wednesday", "colour": "grey"}
+_ASCENSION_DAY = {"label": "Ascension Day", "colour": "blue"}
+_PENTECOST_SUNDAY = {"label": "Pentecost Sunday", "colour": "purple"}
+# Easter-relative feasts as (days from Easter Sunday, event), in key order
+_EASTER_OFFSETS = (
+    (0, _EASTER_SUNDAY),
+    (-2, _GOOD_FRIDAY),
+    (-46, _ASH_WEDNESDAY),
+    (39, _ASCENSION_DAY),
+    (49, _PENTECOST_SUNDAY),
+)
+# Advent labels, indexed by build_christian_events' week counter
+_ADVENT = tuple({"label": f"Advent {i + 1}", "colour": "purple"} for i in range(4))
+
+# --- Civil Holiday Rule Tables ---
+# Rule identifier -> (month, nth Sunday, event). Unknown rules, including
+# the Father's Day "ascension_day" rule, produce no event.
+
+_MOTHERS_DAY_RULES = {
+    "mothering_sunday": (3, 4, _MOTHERS_DAY_UK),
+    "second_sunday_may": (5, 2, _MOTHERS_DAY),
+}
+_FATHERS_DAY_RULES = {
+    "third_sunday_june": (6, 3, _FATHERS_DAY),
+    "first_sunday_september": (9, 1, _FATHERS_DAY_AU),
+}
+_YORKSHIRE_PUDDING_DAY_RULES = {
+    "first_sunday_february": (2, 1, _YORKSHIRE_PUDDING_DAY),
+}
+
+# --- Date Arithmetic Helpers ---
+
+def _add_days(d: date, n: int) -> date:
+    """Return d shifted by n days, via ordinals rather than a timedelta."""
+    return date.fromordinal(d.toordinal() + n)
+
+# Zero-padded month and day strings, indexed by number
+_MONTH2 = tuple(f"{m:02d}" for m in range(13))
+_DAY2 = tuple(f"{d:02d}" for d in range(32))
+
+def _ymd(d: date) -> str:
+    """Format a date as a YYYY-MM-DD key from the padded lookup tables."""
+    return f"{d.year}-" + _MONTH2[d.month] + "-" + _DAY2[d.day]
+
+def _nth_sunday(year: int, month: int, n: int) -> date:
+    """Return the nth Sunday (1-based) of the given month in one step."""
+    first = date(year, month, 1)
+    return _add_days(first, (6 - first.weekday()) % 7 + 7 * (n - 1))
+
+@lru_cache(maxsize=128)
+def _advent_start_ord(year: int) -> int:
+    """Return the ordinal of Advent Sunday (the fourth Sunday before Christmas)."""
+    christmas_ord = date(year, 12, 25).toordinal()
+    # Ordinal 1 (0001-01-01) was a Monday, so (ordinal - 1) % 7 is weekday()
+    return christmas_ord - (christmas_ord - 1) % 7 - 22
 
 # --- Orthodox Easter Calculation ---
 
+@lru_cache(maxsize=256)
 def calculate_orthodox_easter(year: int) -> date:
     """
     Calculate Orthodox Easter Sunday for a given year.
@@ -34,7 +105,7 @@ def calculate_orthodox_easter(year: int) -> date:
     month = (d + e + 114) // 31
     day = ((d + e + 114) % 31) + 1
     julian_easter = date(year, month, day)
-    gregorian_easter = julian_easter + timedelta(days=13)
+    gregorian_easter = _add_days(julian_easter, 13)
     return gregorian_easter
 
 def calculate_florii(year: int) -> dict:
@@ -47,13 +118,11 @@ def calculate_florii(year: int) -> dict:
         year (int): The year to calculate Florii for.
 
     Returns:
-        dict: Dictionary containing Florii keyed by MM-DD.
+        dict: Dictionary containing Florii keyed by YYYY-MM-DD.
     """
     orthodox_easter = calculate_orthodox_easter(year)
-    florii_date = orthodox_easter - timedelta(days=7)
-    return { florii_date.strftime("%m-%d"): {
-        "label": "Florii (Flowers Day) (RO)", "colour": "mediumvioletred"
-    }}
+    florii_date = _add_days(orthodox_easter, -7)
+    return { _ymd(florii_date): _FLORII }
 
 # --- Moveable Cultural Holidays ---
 
@@ -67,13 +136,11 @@ def calculate_volkstrauertag(year: int) -> dict:
         year (int): The year to calculate Volkstrauertag for.
 
     Returns:
-        dict: Dictionary containing Volkstrauertag keyed by MM-DD.
+        dict: Dictionary containing Volkstrauertag keyed by YYYY-MM-DD.
     """
-    christmas = date(year, 12, 25)
-    advent_start = christmas - timedelta(days=christmas.weekday() + 22)
-    volkstrauertag = advent_start - timedelta(weeks=2)
-    event_date = volkstrauertag.strftime("%m-%d")
-    return { event_date: {"label": "Volkstrauertag (Germany)", "colour": "black"} }
+    volkstrauertag = date.fromordinal(_advent_start_ord(year) - 14)
+    event_date = _ymd(volkstrauertag)
+    return { event_date: _VOLKSTRAUERTAG }
 
 def calculate_remembrance_sunday(year: int) -> dict:
     """
@@ -83,17 +150,22 @@ def calculate_remembrance_sunday(year: int) -> dict:
         year (int): The year to calculate Remembrance Sunday for.
 
     Returns:
-        dict: Dictionary containing Remembrance Sunday keyed by MM-DD.
+        dict: Dictionary containing Remembrance Sunday keyed by YYYY-MM-DD.
     """
-    d = date(year, 11, 1)
-    while d.weekday() != 6:
-        d += timedelta(days=1)
-    d += timedelta(weeks=1)
-    event_date = d.strftime("%m-%d")
-    return { event_date: {"label": "Remembrance Sunday", "colour": "red"} }
+    d = _nth_sunday(year, 11, 2)
+    event_date = _ymd(d)
+    return { event_date: _REMEMBRANCE_SUNDAY }
 
 # --- Civil Holiday Rules ---
 
+def _sunday_rule(year: int, rules: dict, rule: str) -> dict:
+    """Look up a (month, nth Sunday, event) rule and return the event keyed by YYYY-MM-DD."""
+    spec = rules.get(rule)
+    if spec is None:
+        return {}
+    month, n, event = spec
+    return { _ymd(_nth_sunday(year, month, n)): event }
+
 def calculate_mothers_day(year: int, rule: str) -> dict:
     """
     Calculate Mother's Day according to country-specific rule.
@@ -103,26 +175,9 @@ def calculate_mothers_day(year: int, rule: str) -> dict:
         rule (str): Rule identifier (e.g. 'mothering_sunday', 'second_sunday_may').
 
     Returns:
-        dict: Dictionary containing Mother's Day keyed by MM-DD.
+        dict: Dictionary containing Mother's Day keyed by YYYY-MM-DD.
     """
-    if rule == "mothering_sunday":
-        d = date(year, 3, 1)
-        while d.weekday() != 6:
-            d += timedelta(days=1)
-        d += timedelta(weeks=3)
-        event_date = d.strftime("%m-%d")
-        label = "Mother's Day (UK)"
-    elif rule == "second_sunday_may":
-        d = date(year, 5, 1)
-        while d.weekday() != 6:
-            d += timedelta(days=1)
-        d += timedelta(weeks=1)
-        event_date = d.strftime("%m-%d")
-        label = "Mother's Day"
-    else:
-        return {}
-
-    return { event_date: {"label": label, "colour": "pink"} }
+    return _sunday_rule(year, _MOTHERS_DAY_RULES, rule)
 
 def calculate_fathers_day(year: int, rule: str) -> dict:
     """
@@ -133,27 +188,9 @@ def calculate_fathers_day(year: int, rule: str) -> dict:
         rule (str): Rule identifier (e.g. 'third_sunday_june', 'first_sunday_september').
 
     Returns:
-        dict: Dictionary containing Father's Day keyed by MM-DD.
+        dict: Dictionary containing Father's Day keyed by YYYY-MM-DD.
     """
-    if rule == "third_sunday_june":
-        d = date(year, 6, 1)
-        while d.weekday() != 6:
-            d += timedelta(days=1)
-        d += timedelta(weeks=2)
-        event_date = d.strftime("%m-%d")
-        label = "Father's Day"
-    elif rule == "first_sunday_september":
-        d = date(year, 9, 1)
-        while d.weekday() != 6:
-            d += timedelta(days=1)
-        event_date = d.strftime("%m-%d")
-        label = "Father's Day (AU)"
-    elif rule == "ascension_day":
-        return {}
-    else:
-        return {}
-
-    return { event_date: {"label": label, "colour": "blue"} }
+    return _sunday_rule(year, _FATHERS_DAY_RULES, rule)
 
 def calculate_yorkshire_pudding_day(year: int, rule: str) -> dict:
     """
@@ -164,19 +201,13 @@ def calculate_yorkshire_pudding_day(year: int, rule: str) -> dict:
         rule (str): Rule identifier (e.g. 'first_sunday_february').
 
     Returns:
-        dict: Dictionary containing Yorkshire Pudding Day keyed by MM-DD.
+        dict: Dictionary containing Yorkshire Pudding Day keyed by YYYY-MM-DD.
     """
-    if rule == "first_sunday_february":
-        d = date(year, 2, 1)
-        while d.weekday() != 6:
-            d += timedelta(days=1)
-        event_date = d.strftime("%m-%d")
-        return { event_date: {"label": "Yorkshire Pudding Day", "colour": "goldenrod"} }
-    else:
-        return {}
+    return _sunday_rule(year, _YORKSHIRE_PUDDING_DAY_RULES, rule)
 
 # --- Christian Moveable Feast Calculations ---
 
+@lru_cache(maxsize=256)
 def calculate_easter_date(year: int) -> date:
     """
     Calculate Western Easter Sunday (Gregorian) for a given year.
@@ -205,36 +236,30 @@ def calculate_easter_date(year: int) -> date:
     day = ((h + l - 7 * m + 114) % 31) + 1
     return date(year, month, day)
 
+@lru_cache(maxsize=32)
 def build_christian_events(year: int) -> dict:
     """
     Generate rule-based Christian feasts for the given year.
 
     Includes Ash Wednesday, Good Friday, Easter Sunday, Ascension Day,
-    Pentecost Sunday, and Advent Sundays.
+    Pentecost Sunday, and Advent Sundays. Memoised per year; the returned
+    dictionary is shared and must be treated as read-only.
 
     Args:
         year (int): The year to calculate feasts for.
 
     Returns:
-        dict: Dictionary of Christian events keyed by MM-DD.
+        dict: Dictionary of Christian events keyed by YYYY-MM-DD.
     """
-    data = {}
-    easter = calculate_easter_date(year)
+    easter_ord = calculate_easter_date(year).toordinal()
+    data = {_ymd(date.fromordinal(easter_ord + offset)): event
+            for offset, event in _EASTER_OFFSETS}
 
-    data[easter.strftime("%m-%d")] = {"label": "Easter Sunday", "colour": "pink"}
-    data[(easter - timedelta(days=2)).strftime("%m-%d")] = {"label": "Good Friday", "colour": "red"}
-    data[(easter - timedelta(days=46)).strftime("%m-%d")] = {"label": "Ash Wednesday", "colour": "grey"}
-    data[(easter + timedelta(days=39)).strftime("%m-%d")] = {"label": "Ascension Day", "colour": "blue"}
-    data[(easter + timedelta(days=49)).strftime("%m-%d")] = {"label": "Pentecost Sunday", "colour": "purple"}
-
-    christmas = date(year, 12, 25)
-    advent_start = christmas - timedelta(days=christmas.weekday() + 22)
+    advent_ord = _advent_start_ord(year)
     for i in range(4):
-        sunday = advent_start - timedelta(weeks=i)
-        event_date = sunday.strftime("%m-%d")
-        data[event_date] = {"label": f"Advent {4 - i}", "colour": "purple"}
+        data[_ymd(date.fromordinal(advent_ord + 7 * i))] = _ADVENT[i]
 
-    return update_year_key(year, data)
+    return data
 
 
 # --- Master Rule Engine ---
@@ -250,31 +275,72 @@ def build_variable_event_dataset(year: int, country_code: str = "GB") -> dict:
     Returns:
         dict: Dictionary of calculated holidays keyed by YYYY-MM-DD.
     """
+    return dict(_build_country_events(year, country_code))
+
+def build_variable_event_datasets(year: int, country_codes) -> list:
+    """
+    Build variable event datasets for several countries in one batch.
+
+    Results are memoised per (year, country), and year-wide work (the
+    Christian feasts, the Easter dates) is shared between every country that
+    needs it. The returned dictionaries are shared and must be treated as
+    read-only by callers.
+
+    Args:
+        year (int): The year to calculate events for.
+        country_codes (iterable): ISO 2-letter country codes.
+
+    Returns:
+        list: One dictionary per country code (in the same order), keyed by YYYY-MM-DD.
+    """
+    return [_build_country_events(year, country_code) for country_code in country_codes]
+
+@lru_cache(maxsize=128)
+def _build_country_events(year: int, country_code: str) -> dict:
+    """Cached worker for build_variable_event_datasets, keyed on (year, country code)."""
     data = {}
+    for build in _country_builders(country_code):
+        # Unknown rules yield an empty dict; skip merging those
+        events = build(year)
+        if events:
+            data.update(events)
+
+    return data
+
+@lru_cache(maxsize=None)
+def _country_builders(country_code: str) -> tuple:
+    """
+    Resolve a country's variable rules once into the calculators it needs.
+
+    Returns a tuple of callables taking only the year, in the order their
+    results are merged, with any rule arguments already bound.
+    """
+    builders = []
     rules = load_variable_rules()
-    country_rules = rules.get(country_code.upper(), {})
+    # Callers normally pass upper-case codes; only fold case on a miss
+    country_rules = rules.get(country_code) or rules.get(country_code.upper(), {})
 
     if "mothers_day" in country_rules:
-        data.update(calculate_mothers_day(year, country_rules["mothers_day"]))
+        builders.append(partial(calculate_mothers_day, rule=country_rules["mothers_day"]))
 
     if "fathers_day" in country_rules:
-        data.update(calculate_fathers_day(year, country_rules["fathers_day"]))
+        builders.append(partial(calculate_fathers_day, rule=country_rules["fathers_day"]))
 
     if "yorkshire_pudding_day" in country_rules:
-        data.update(calculate_yorkshire_pudding_day(year, country_rules["yorkshire_pudding_day"]))
+        builders.append(partial(calculate_yorkshire_pudding_day, rule=country_rules["yorkshire_pudding_day"]))
 
     if country_rules.get("christian", False):
-        data.update(build_christian_events(year))
+        builders.append(build_christian_events)
 
     moveable = country_rules.get("moveable_cultural", {})
 
     if moveable.get("remembrance_sunday", False):
-        data.update(calculate_remembrance_sunday(year))
+        builders.append(calculate_remembrance_sunday)
 
     if moveable.get("volkstrauertag", False):
-        data.update(calculate_volkstrauertag(year))
+        builders.append(calculate_volkstrauertag)
 
     if moveable.get("florii", False):
-        data.update(calculate_florii(year))
+        builders.append(calculate_florii)
 
-    return update_year_key(year, data)
+    return tuple(builders)